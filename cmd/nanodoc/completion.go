@@ -2,7 +2,6 @@ package main
 
 import (
 	_ "embed"
-	"os"
 
 	"github.com/spf13/cobra"
 )
@@ -21,13 +20,13 @@ var completionCmd = &cobra.Command{
 	RunE: func(cmd *cobra.Command, args []string) error {
 		switch args[0] {
 		case "bash":
-			return cmd.Root().GenBashCompletion(os.Stdout)
+			return cmd.Root().GenBashCompletion(cmd.OutOrStdout())
 		case "zsh":
-			return cmd.Root().GenZshCompletion(os.Stdout)
+			return cmd.Root().GenZshCompletion(cmd.OutOrStdout())
 		case "fish":
-			return cmd.Root().GenFishCompletion(os.Stdout, true)
+			return cmd.Root().GenFishCompletion(cmd.OutOrStdout(), true)
 		case "powershell":
-			return cmd.Root().GenPowerShellCompletionWithDesc(os.Stdout)
+			return cmd.Root().GenPowerShellCompletionWithDesc(cmd.OutOrStdout())
 		}
 		return nil
 	},
@@ -1,43 +1,27 @@
 package main
 
 import (
-	"bytes"
-	"os"
-	"os/exec"
-	"strings"
 	"testing"
 
 	"github.com/spf13/cobra"
 )
 
 func TestCompletionOutput(t *testing.T) {
-	// Get project root from environment or use relative path
-	projectRoot := os.Getenv("PROJECT_ROOT")
-	if projectRoot == "" {
-		// If PROJECT_ROOT is not set, we're already in the right directory
-		projectRoot = "."
-	} else {
-		// If PROJECT_ROOT is set, navigate to cmd/nanodoc
-		projectRoot = projectRoot + "/cmd/nanodoc"
-	}
-	
-	// Build the binary first
-	buildCmd := exec.Command("go", "build", "-o", "/tmp/nanodoc-test", ".")
-	buildCmd.Dir = projectRoot
-	if err := buildCmd.Run(); err != nil {
-		t.Fatalf("Failed to build binary: %v", err)
-	}
-	defer func() { _ = os.Remove("/tmp/nanodoc-test") }()
-
+	// Completions are served in-process through cobra's hidden __complete
+	// command, the same entry point the shell scripts call into
 	tests := []struct {
 		name            string
 		args            []string
 		wantContains    []string
 		wantNotContains []string
+		// allowErr is set for __complete rows, which may report an error
+		// for the partial command line they are given
+		allowErr bool
 	}{
 		{
-			name: "flag completion",
-			args: []string{"__complete", "nanodoc", "-"},
+			name:     "flag completion",
+			allowErr: true,
+			args:     []string{"__complete", "nanodoc", "-"},
 			wantContains: []string{
 				"--theme",
 				"--header-format",
@@ -47,8 +31,9 @@ func TestCompletionOutput(t *testing.T) {
 			},
 		},
 		{
-			name: "theme value completion",
-			args: []string{"__complete", "nanodoc", "--theme", ""},
+			name:     "theme value completion",
+			allowErr: true,
+			args:     []string{"__complete", "nanodoc", "--theme", ""},
 			wantContains: []string{
 				"classic",
 				"classic-dark",
@@ -56,8 +41,9 @@ func TestCompletionOutput(t *testing.T) {
 			},
 		},
 		{
-			name: "header-format value completion",
-			args: []string{"__complete", "nanodoc", "--header-format", ""},
+			name:     "header-format value completion",
+			allowErr: true,
+			args:     []string{"__complete", "nanodoc", "--header-format", ""},
 			wantContains: []string{
 				"nice",
 				"simple",
@@ -67,8 +53,9 @@ func TestCompletionOutput(t *testing.T) {
 			},
 		},
 		{
-			name: "file-numbering value completion",
-			args: []string{"__complete", "nanodoc", "--file-numbering", ""},
+			name:     "file-numbering value completion",
+			allowErr: true,
+			args:     []string{"__complete", "nanodoc", "--file-numbering", ""},
 			wantContains: []string{
 				"numerical",
 				"alphabetical",
@@ -76,42 +63,44 @@ func TestCompletionOutput(t *testing.T) {
 			},
 		},
 		{
-			name: "linenum value completion",
-			args: []string{"__complete", "nanodoc", "--linenum", ""},
+			name:     "linenum value completion",
+			allowErr: true,
+			args:     []string{"__complete", "nanodoc", "--linenum", ""},
 			wantContains: []string{
 				"file",
 				"global",
 			},
 		},
+		{
+			name:         "bash script",
+			args:         []string{"completion", "bash"},
+			wantContains: []string{"bash completion for nanodoc"},
+		},
+		{
+			name:         "zsh script",
+			args:         []string{"completion", "zsh"},
+			wantContains: []string{"#compdef nanodoc"},
+		},
+		{
+			name:         "fish script",
+			args:         []string{"completion", "fish"},
+			wantContains: []string{"fish completion for nanodoc"},
+		},
+		{
+			name:         "powershell script",
+			args:         []string{"completion", "powershell"},
+			wantContains: []string{"powershell completion for nanodoc"},
+		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			cmd := exec.Command("/tmp/nanodoc-test", tt.args...)
-			var out bytes.Buffer
-			cmd.Stdout = &out
-			cmd.Stderr = &out
-
-			if err := cmd.Run(); err != nil {
-				// __complete returns exit code 1, which is expected
-				if exitErr, ok := err.(*exec.ExitError); !ok || exitErr.ExitCode() != 1 {
-					t.Fatalf("Command failed with unexpected error: %v\nOutput: %s", err, out.String())
-				}
+			output, err := executeCommand(tt.args...)
+			if err != nil && !tt.allowErr {
+				t.Fatalf("executeCommand(%v) error = %v\nOutput:\n%s", tt.args, err, output)
 			}
 
-			output := out.String()
-
-			for _, want := range tt.wantContains {
-				if !strings.Contains(output, want) {
-					t.Errorf("Output does not contain %q.\nGot:\n%s", want, output)
-				}
-			}
-
-			for _, notWant := range tt.wantNotContains {
-				if strings.Contains(output, notWant) {
-					t.Errorf("Output contains %q but should not.\nGot:\n%s", notWant, output)
-				}
-			}
+			assertOutput(t, output, tt.wantContains, tt.wantNotContains)
 		})
 	}
 }
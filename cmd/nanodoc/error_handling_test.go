@@ -8,81 +8,103 @@ import (
 	"testing"
 )
 
+// runMainEnv, when set to "1", makes the test binary behave as the nanodoc
+// binary so tests can exercise real process exit codes and stderr
+const runMainEnv = "NANODOC_TEST_RUN_MAIN"
+
+func TestMain(m *testing.M) {
+	if os.Getenv(runMainEnv) == "1" {
+		main()
+		os.Exit(0)
+	}
+	os.Exit(m.Run())
+}
+
+// cliErrorTests are invalid invocations and the error each one must report
+var cliErrorTests = []struct {
+	name      string
+	args      []string
+	wantError string
+}{
+	{
+		name:      "invalid flag",
+		args:      []string{"--invalid-option"},
+		wantError: "unknown flag: --invalid-option",
+	},
+	{
+		name:      "invalid linenum value",
+		args:      []string{"--linenum", "invalid", "README.md"},
+		wantError: "invalid --linenum value: invalid (must be 'file' or 'global')",
+	},
+	{
+		name:      "invalid output format",
+		args:      []string{"--output-format", "wrongformat", "README.md"},
+		wantError: "invalid --output-format value: wrongformat (must be 'term', 'plain', or 'markdown')",
+	},
+	{
+		name:      "missing required arguments",
+		args:      []string{},
+		wantError: "Missing paths to bundle",
+	},
+}
+
+// TestCLIErrorMessages checks the reported errors in-process, so they stay
+// covered in -short runs without starting a process per case
+func TestCLIErrorMessages(t *testing.T) {
+	for _, tt := range cliErrorTests {
+		t.Run(tt.name, func(t *testing.T) {
+			output, err := executeCommand(tt.args...)
+			if err == nil {
+				t.Fatalf("Expected an error, got none\nOutput:\n%s", output)
+			}
+			assertOutput(t, output, []string{tt.wantError}, nil)
+		})
+	}
+}
+
 // TestCLIErrorDisplay ensures that CLI errors are properly displayed to users
-// This test prevents regression of issue #66 where errors were silently swallowed
+// This test prevents regression of issue #66 where errors were silently swallowed.
+// The messages themselves are covered in-process by TestCLIErrorMessages;
+// one real process is enough to check that main reports them on stderr and
+// exits non-zero.
 func TestCLIErrorDisplay(t *testing.T) {
 	// Skip if not in CI or if explicitly requested
 	if os.Getenv("SKIP_INTEGRATION_TESTS") == "true" {
 		t.Skip("Skipping integration test")
 	}
-
-	// Build the binary
-	cmd := exec.Command("go", "build", "-o", "test-nanodoc", ".")
-	cmd.Dir = "."
-	if err := cmd.Run(); err != nil {
-		t.Fatalf("Failed to build binary: %v", err)
+	// It starts a new process, so leave it out of quick -short runs
+	if testing.Short() {
+		t.Skip("Skipping subprocess test in short mode")
 	}
-	defer func() { _ = os.Remove("test-nanodoc") }()
 
-	tests := []struct {
-		name           string
-		args           []string
-		wantError      string
-		wantExitCode   int
-	}{
-		{
-			name:         "invalid flag",
-			args:         []string{"--invalid-option"},
-			wantError:    "unknown flag: --invalid-option",
-			wantExitCode: 1,
-		},
-		{
-			name:         "invalid linenum value",
-			args:         []string{"--linenum", "invalid", "README.md"},
-			wantError:    "invalid --linenum value: invalid (must be 'file' or 'global')",
-			wantExitCode: 1,
-		},
-		{
-			name:         "invalid output format",
-			args:         []string{"--output-format", "wrongformat", "README.md"},
-			wantError:    "invalid --output-format value: wrongformat (must be 'term', 'plain', or 'markdown')",
-			wantExitCode: 1,
-		},
-		{
-			name:         "missing required arguments",
-			args:         []string{},
-			wantError:    "Missing paths to bundle",
-			wantExitCode: 1,
-		},
+	// Re-run this test binary as nanodoc (see TestMain) instead of
+	// compiling a separate binary for the run
+	binary, err := os.Executable()
+	if err != nil {
+		t.Fatalf("Failed to locate test binary: %v", err)
 	}
 
-	for _, tt := range tests {
-		t.Run(tt.name, func(t *testing.T) {
-			cmd := exec.Command("./test-nanodoc", tt.args...)
-			var stderr bytes.Buffer
-			cmd.Stderr = &stderr
-
-			err := cmd.Run()
+	const wantError = "invalid --linenum value: invalid (must be 'file' or 'global')"
+	cmd := exec.Command(binary, "--linenum", "invalid", "README.md")
+	// nanodoc reads no environment variables, so the child only
+	// gets the switch that makes it run main
+	cmd.Env = []string{runMainEnv + "=1"}
+	var stderr bytes.Buffer
+	cmd.Stderr = &stderr
 
-			// Check exit code
-			if exitError, ok := err.(*exec.ExitError); ok {
-				if exitError.ExitCode() != tt.wantExitCode {
-					t.Errorf("Expected exit code %d, got %d", tt.wantExitCode, exitError.ExitCode())
-				}
-			} else if tt.wantExitCode != 0 {
-				t.Errorf("Expected exit code %d, but command succeeded", tt.wantExitCode)
-			}
+	err = cmd.Run()
 
-			// Check error message
-			stderrStr := stderr.String()
-			if !strings.Contains(stderrStr, tt.wantError) {
-				t.Errorf("Expected error containing %q, got %q", tt.wantError, stderrStr)
-			}
+	// Check exit code
+	if exitError, ok := err.(*exec.ExitError); ok {
+		if exitError.ExitCode() != 1 {
+			t.Errorf("Expected exit code 1, got %d", exitError.ExitCode())
+		}
+	} else {
+		t.Errorf("Expected exit code 1, but command succeeded")
+	}
 
-			// Ensure error is not empty when exit code is non-zero
-			if tt.wantExitCode != 0 && stderrStr == "" {
-				t.Error("Expected error message but stderr was empty")
-			}
-		})
+	// Check error message
+	if stderrStr := stderr.String(); !strings.Contains(stderrStr, wantError) {
+		t.Errorf("Expected error containing %q, got %q", wantError, stderrStr)
 	}
-}
\ No newline at end of file
+}
@@ -6,6 +6,7 @@ import (
 	"fmt"
 	"sort"
 	"strings"
+	"sync"
 
 	"github.com/spf13/cobra"
 	"github.com/spf13/pflag"
@@ -125,10 +126,15 @@ func flagUsage(f *pflag.Flag) string {
 	return buf.String()
 }
 
-// helpTopics returns formatted help topics
-func helpTopics() string {
+// helpTopics returns formatted help topics. The embedded docs never change
+// at runtime, so the block is rendered once and reused by every help and
+// usage template execution.
+var helpTopics = sync.OnceValue(renderHelpTopics)
+
+// renderHelpTopics formats the embedded topics as a help section
+func renderHelpTopics() string {
 	// Get available topics
-	topics, err := getAvailableTopics()
+	topics, err := embeddedTopics()
 	if err != nil {
 		return ""
 	}
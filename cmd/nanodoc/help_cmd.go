@@ -21,7 +21,7 @@ You can also type nanodoc help [topic] to read about a specific topic.`,
 
 		// Check if it's a topic
 		topic := args[0]
-		content, err := findAndReadTopic(topic)
+		content, err := findAndReadTopic(docsFS, topic)
 		if err == nil {
 			// It's a valid topic, show it
 			_, _ = fmt.Fprint(cmd.OutOrStdout(), content)
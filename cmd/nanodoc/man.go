@@ -4,7 +4,6 @@ import (
 	"fmt"
 	"github.com/spf13/cobra"
 	"github.com/spf13/cobra/doc"
-	"os"
 )
 
 var manCmd = &cobra.Command{
@@ -21,7 +20,7 @@ var manCmd = &cobra.Command{
 		}
 
 		// Generate man page to stdout
-		err := doc.GenMan(rootCmd, header, os.Stdout)
+		err := doc.GenMan(rootCmd, header, cmd.OutOrStdout())
 		if err != nil {
 			return fmt.Errorf(ErrFailedGenManPage, err)
 		}
@@ -0,0 +1,12 @@
+package main
+
+import "testing"
+
+func TestManOutput(t *testing.T) {
+	output, err := executeCommand("man")
+	if err != nil {
+		t.Fatalf("executeCommand(man) error = %v", err)
+	}
+
+	assertOutput(t, output, []string{".TH", ".SH NAME", "nanodoc"}, nil)
+}
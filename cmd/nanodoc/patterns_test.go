@@ -1,15 +1,12 @@
 package main
 
 import (
-	"os"
-	"path/filepath"
-	"strings"
 	"testing"
 )
 
 func TestRootCmdWithPatterns(t *testing.T) {
-	tempDir, cleanup := setupTest(t)
-	defer cleanup()
+	// The patterns only need the tree below, not setupTest's files
+	tempDir := t.TempDir()
 	
 	// Create test directory structure
 	testFiles := map[string]string{
@@ -22,16 +19,7 @@ func TestRootCmdWithPatterns(t *testing.T) {
 		"test/unit.md":       "# Unit Tests\nUnit test docs",
 	}
 	
-	for path, content := range testFiles {
-		fullPath := filepath.Join(tempDir, path)
-		dir := filepath.Dir(fullPath)
-		if err := os.MkdirAll(dir, 0755); err != nil {
-			t.Fatal(err)
-		}
-		if err := os.WriteFile(fullPath, []byte(content), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
+	writeTestFiles(t, tempDir, testFiles)
 	
 	tests := []struct {
 		name          string
@@ -102,8 +90,6 @@ func TestRootCmdWithPatterns(t *testing.T) {
 	
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			resetFlags()
-			
 			output, err := executeCommand(tt.args...)
 			
 			if (err != nil) != tt.wantErr {
@@ -111,17 +97,7 @@ func TestRootCmdWithPatterns(t *testing.T) {
 				return
 			}
 			
-			for _, want := range tt.wantContains {
-				if !strings.Contains(output, want) {
-					t.Errorf("Output does not contain %q.\nGot:\n%s", want, output)
-				}
-			}
-			
-			for _, dontWant := range tt.dontWant {
-				if strings.Contains(output, dontWant) {
-					t.Errorf("Output contains %q, but should not.\nGot:\n%s", dontWant, output)
-				}
-			}
+			assertOutput(t, output, tt.wantContains, tt.dontWant)
 		})
 	}
 }
\ No newline at end of file
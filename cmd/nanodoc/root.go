@@ -277,12 +277,41 @@ func Execute() error {
 	return rootCmd.Execute()
 }
 
+// registerFlagCompletions registers the value completions of the root
+// command's flags. Completions are bound to the flag instances, so they
+// must be registered again whenever the flags are redefined.
+func registerFlagCompletions(cmd *cobra.Command) {
+	_ = cmd.RegisterFlagCompletionFunc("linenum", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
+		return []string{"file", "global"}, cobra.ShellCompDirectiveNoFileComp
+	})
+	_ = cmd.RegisterFlagCompletionFunc("theme", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
+		themes, err := nanodoc.GetAvailableThemes()
+		if err != nil {
+			return nil, cobra.ShellCompDirectiveError
+		}
+		return themes, cobra.ShellCompDirectiveNoFileComp
+	})
+	_ = cmd.RegisterFlagCompletionFunc("header-format", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
+		return []string{"nice", "simple", "path", "filename", "title"}, cobra.ShellCompDirectiveNoFileComp
+	})
+	_ = cmd.RegisterFlagCompletionFunc("header-align", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
+		return []string{"left", "center", "right"}, cobra.ShellCompDirectiveNoFileComp
+	})
+	_ = cmd.RegisterFlagCompletionFunc("header-style", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
+		// Dynamically get banner styles from registry
+		return nanodoc.GetBannerStyleNames(), cobra.ShellCompDirectiveNoFileComp
+	})
+	_ = cmd.RegisterFlagCompletionFunc("file-numbering", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
+		return []string{"numerical", "alphabetical", "roman"}, cobra.ShellCompDirectiveNoFileComp
+	})
+	_ = cmd.RegisterFlagCompletionFunc("output-format", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
+		return []string{"term", "plain", "markdown"}, cobra.ShellCompDirectiveNoFileComp
+	})
+}
+
 func init() {
 	// Line numbering flag
 	rootCmd.Flags().StringVarP(&lineNum, "linenum", "l", "", FlagLineNum)
-	_ = rootCmd.RegisterFlagCompletionFunc("linenum", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
-		return []string{"file", "global"}, cobra.ShellCompDirectiveNoFileComp
-	})
 	_ = rootCmd.Flags().SetAnnotation("linenum", "group", []string{"Formatting"})
 
 	// TOC flag
@@ -291,37 +320,17 @@ func init() {
 
 	// Theme flag
 	rootCmd.Flags().StringVar(&theme, "theme", "classic", FlagTheme)
-	_ = rootCmd.RegisterFlagCompletionFunc("theme", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
-		themes, err := nanodoc.GetAvailableThemes()
-		if err != nil {
-			return nil, cobra.ShellCompDirectiveError
-		}
-		return themes, cobra.ShellCompDirectiveNoFileComp
-	})
 	_ = rootCmd.Flags().SetAnnotation("theme", "group", []string{"Formatting"})
 
 	// File name flags
 	rootCmd.Flags().BoolVar(&showFilenames, "filenames", true, FlagFilenames)
 	rootCmd.Flags().StringVar(&filenameFormat, "header-format", "nice", FlagHeaderFormat)
-	_ = rootCmd.RegisterFlagCompletionFunc("header-format", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
-		return []string{"nice", "simple", "path", "filename", "title"}, cobra.ShellCompDirectiveNoFileComp
-	})
 	rootCmd.Flags().StringVar(&filenameAlign, "header-align", "left", FlagHeaderAlign)
-	_ = rootCmd.RegisterFlagCompletionFunc("header-align", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
-		return []string{"left", "center", "right"}, cobra.ShellCompDirectiveNoFileComp
-	})
 	rootCmd.Flags().StringVar(&filenameBanner, "header-style", "none", FlagHeaderStyle)
-	_ = rootCmd.RegisterFlagCompletionFunc("header-style", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
-		// Dynamically get banner styles from registry
-		return nanodoc.GetBannerStyleNames(), cobra.ShellCompDirectiveNoFileComp
-	})
 	// Auto-detect terminal width as default for page width
 	defaultPageWidth := nanodoc.GetTerminalWidth()
 	rootCmd.Flags().IntVar(&pageWidth, "page-width", defaultPageWidth, FlagPageWidth)
 	rootCmd.Flags().StringVar(&fileNumbering, "file-numbering", "numerical", FlagFileNumbering)
-	_ = rootCmd.RegisterFlagCompletionFunc("file-numbering", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
-		return []string{"numerical", "alphabetical", "roman"}, cobra.ShellCompDirectiveNoFileComp
-	})
 	_ = rootCmd.Flags().SetAnnotation("filenames", "group", []string{"Features"})
 	_ = rootCmd.Flags().SetAnnotation("header-format", "group", []string{"Formatting"})
 	_ = rootCmd.Flags().SetAnnotation("header-align", "group", []string{"Formatting"})
@@ -341,14 +350,14 @@ func init() {
 	rootCmd.Flags().BoolVar(&dryRun, "dry-run", false, FlagDryRun)
 	rootCmd.Flags().StringVar(&saveToBundlePath, "save-to-bundle", "", FlagSaveToBundle)
 	rootCmd.Flags().StringVar(&outputFormat, "output-format", "term", FlagOutputFormat)
-	_ = rootCmd.RegisterFlagCompletionFunc("output-format", func(cmd *cobra.Command, args []string, toComplete string) ([]string, cobra.ShellCompDirective) {
-		return []string{"term", "plain", "markdown"}, cobra.ShellCompDirectiveNoFileComp
-	})
 	rootCmd.Flags().BoolP("version", "v", false, FlagVersion)
 	_ = rootCmd.Flags().SetAnnotation("dry-run", "group", []string{"Misc"})
 	_ = rootCmd.Flags().SetAnnotation("save-to-bundle", "group", []string{"Features"})
 	_ = rootCmd.Flags().SetAnnotation("version", "group", []string{"Misc"})
 	_ = rootCmd.Flags().SetAnnotation("help", "group", []string{"Misc"})
+
+	// Flag value completions
+	registerFlagCompletions(rootCmd)
 	
 	// Initialize custom help system
 	initHelpSystem()
@@ -8,31 +8,59 @@ import (
 	"testing"
 )
 
-// setupTest creates temporary files and returns a cleanup function.
-func setupTest(t *testing.T) (string, func()) {
+// setupTest creates temporary files in a directory that is removed when
+// the test finishes.
+func setupTest(t *testing.T) string {
 	t.Helper()
-	tempDir, err := os.MkdirTemp("", "nanodoc-cli-test-*")
-	if err != nil {
-		t.Fatalf("Failed to create temp dir: %v", err)
-	}
+	tempDir := t.TempDir()
 
 	// Create test files
-	if err := os.WriteFile(filepath.Join(tempDir, "file1.txt"), []byte("hello\nworld"), 0644); err != nil {
-		t.Fatalf("Failed to write file1.txt: %v", err)
-	}
-	if err := os.WriteFile(filepath.Join(tempDir, "file2.md"), []byte("# Title\n\ncontent"), 0644); err != nil {
-		t.Fatalf("Failed to write file2.md: %v", err)
+	writeTestFiles(t, tempDir, map[string]string{
+		"file1.txt": "hello\nworld",
+		"file2.md":  "# Title\n\ncontent",
+	})
+
+	return tempDir
+}
+
+// writeTestFiles creates each file in files, keyed by its path relative to
+// dir, along with any parent directories it needs.
+func writeTestFiles(t *testing.T, dir string, files map[string]string) {
+	t.Helper()
+	for path, content := range files {
+		fullPath := filepath.Join(dir, path)
+		if err := os.MkdirAll(filepath.Dir(fullPath), 0755); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.WriteFile(fullPath, []byte(content), 0644); err != nil {
+			t.Fatal(err)
+		}
 	}
+}
 
-	cleanup := func() {
-		_ = os.RemoveAll(tempDir)
+// chdir switches the working directory to dir for the rest of the test
+// and switches back when the test finishes. Tests that use it must not
+// call t.Parallel, since the working directory is process-wide.
+func chdir(t *testing.T, dir string) {
+	t.Helper()
+	oldDir, err := os.Getwd()
+	if err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Chdir(dir); err != nil {
+		t.Fatal(err)
 	}
-	return tempDir, cleanup
+	t.Cleanup(func() {
+		if err := os.Chdir(oldDir); err != nil {
+			t.Errorf("Failed to change back to original dir: %v", err)
+		}
+	})
 }
 
 func executeCommand(args ...string) (string, error) {
 	var out bytes.Buffer
-	// Reset flags before each test
+	// Global CLI state is reset here for every run, so tests never need to
+	// reset it themselves
 	resetFlags()
 	
 	// Reset all flag values to ensure clean state
@@ -54,6 +82,7 @@ func executeCommand(args ...string) (string, error) {
 	rootCmd.Flags().StringVar(&saveToBundlePath, "save-to-bundle", "", FlagSaveToBundle)
 	rootCmd.Flags().StringVar(&outputFormat, "output-format", "term", FlagOutputFormat)
 	rootCmd.Flags().BoolP("version", "v", false, FlagVersion)
+	registerFlagCompletions(rootCmd)
 	
 	// Use the actual root command
 	rootCmd.SetOut(&out)
@@ -65,8 +94,7 @@ func executeCommand(args ...string) (string, error) {
 }
 
 func TestRootCmd(t *testing.T) {
-	tempDir, cleanup := setupTest(t)
-	defer cleanup()
+	tempDir := setupTest(t)
 
 	file1 := filepath.Join(tempDir, "file1.txt")
 	file2 := filepath.Join(tempDir, "file2.md")
@@ -138,13 +166,14 @@ func TestRootCmd(t *testing.T) {
 		{
 			name:       "help flag",
 			args:       []string{"--help"},
-			wantOutput: []string{"a minimal document bundler"},
+			// One help render covers the description, the options and the topics
+			wantOutput: []string{"a minimal document bundler", "--toc", "--linenum", "--theme", "--ext", "HELP TOPICS"},
 			wantErr:    false,
 		},
 		{
 			name:       "help command",
 			args:       []string{"help"},
-			wantOutput: []string{"a minimal document bundler"},
+			wantOutput: []string{"a minimal document bundler", "HELP TOPICS"},
 			wantErr:    false,
 		},
 		{
@@ -156,9 +185,6 @@ func TestRootCmd(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			// Reset flags before each run
-			resetFlags()
-
 			output, err := executeCommand(tt.args...)
 
 			if (err != nil) != tt.wantErr {
@@ -166,45 +192,28 @@ func TestRootCmd(t *testing.T) {
 				return
 			}
 
-			for _, want := range tt.wantOutput {
-				if !strings.Contains(output, want) {
-					t.Errorf("Output does not contain %q.\nGot:\n%s", want, output)
-				}
-			}
-			
-			for _, dontWant := range tt.dontWantOutput {
-				if strings.Contains(output, dontWant) {
-					t.Errorf("Output contains %q, but should not.\nGot:\n%s", dontWant, output)
-				}
-			}
+			assertOutput(t, output, tt.wantOutput, tt.dontWantOutput)
 		})
 	}
 }
 
 func TestRootCmdBundleOptions(t *testing.T) {
-	tempDir, cleanup := setupTest(t)
-	defer cleanup()
-
-	// Create test file
-	testFile := filepath.Join(tempDir, "test.txt")
-	if err := os.WriteFile(testFile, []byte("line1\nline2\nline3"), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// Create bundle file with options
+	// The bundle and the one file it lists are all this test reads, and
+	// every subtest renders the same pair
+	tempDir := t.TempDir()
+	writeTestFiles(t, tempDir, map[string]string{
+		"test.txt": "line1\nline2\nline3",
+		"test.bundle.txt": strings.Join([]string{
+			"# Bundle with options",
+			"--toc",
+			"--theme classic-dark",
+			"--header-format path",
+			"--linenum file",
+			"",
+			"test.txt",
+		}, "\n"),
+	})
 	bundleFile := filepath.Join(tempDir, "test.bundle.txt")
-	bundleContent := []string{
-		"# Bundle with options",
-		"--toc",
-		"--theme classic-dark",
-		"--header-format path",
-		"--linenum file",
-		"",
-		"test.txt",
-	}
-	if err := os.WriteFile(bundleFile, []byte(strings.Join(bundleContent, "\n")), 0644); err != nil {
-		t.Fatal(err)
-	}
 
 	tests := []struct {
 		name          string
@@ -250,30 +259,38 @@ func TestRootCmdBundleOptions(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			// Reset flags before each run
-			resetFlags()
-
 			output, err := executeCommand(tt.args...)
 			if err != nil {
 				t.Errorf("executeCommand() error = %v\nOutput:\n%s", err, output)
 				return
 			}
 
-			for _, want := range tt.wantOutput {
-				if !strings.Contains(output, want) {
-					t.Errorf("Output does not contain %q.\nGot:\n%s", want, output)
-				}
-			}
-			
-			for _, dontWant := range tt.dontWantOutput {
-				if strings.Contains(output, dontWant) {
-					t.Errorf("Output contains %q, but should not.\nGot:\n%s", dontWant, output)
-				}
-			}
+			assertOutput(t, output, tt.wantOutput, tt.dontWantOutput)
 		})
 	}
 }
 
+// assertOutput checks that output contains every want substring and none
+// of the dontWant substrings, reporting all mismatches in a single error
+// so the output is printed once rather than once per substring.
+func assertOutput(t *testing.T, output string, want, dontWant []string) {
+	t.Helper()
+	var missing, unexpected []string
+	for _, w := range want {
+		if !strings.Contains(output, w) {
+			missing = append(missing, w)
+		}
+	}
+	for _, d := range dontWant {
+		if strings.Contains(output, d) {
+			unexpected = append(unexpected, d)
+		}
+	}
+	if len(missing) > 0 || len(unexpected) > 0 {
+		t.Errorf("Output is missing %q and contains unwanted %q.\nGot:\n%s", missing, unexpected, output)
+	}
+}
+
 // resetFlags resets all persistent flags to their default values.
 func resetFlags() {
 	lineNum = ""
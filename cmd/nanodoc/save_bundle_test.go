@@ -71,30 +71,20 @@ func TestSaveToBundleFlag(t *testing.T) {
 		},
 	}
 
-	for _, tt := range tests {
-		t.Run(tt.name, func(t *testing.T) {
-			// Create a temporary directory for test files
-			tempDir := t.TempDir()
-			oldDir, _ := os.Getwd()
-			defer func() { _ = os.Chdir(oldDir) }()
-			if err := os.Chdir(tempDir); err != nil {
-				t.Fatalf("Failed to change directory: %v", err)
-			}
+	// The source files are only read, so every case shares one fixture
+	// directory; each case writes its own bundle file.
+	tempDir := t.TempDir()
+	chdir(t, tempDir)
 
-			// Create test files
-			if err := os.WriteFile("README.md", []byte("# Test\nContent"), 0644); err != nil {
-				t.Fatalf("Failed to create README.md: %v", err)
-			}
-			if err := os.WriteFile("LICENSE", []byte("MIT License"), 0644); err != nil {
-				t.Fatalf("Failed to create LICENSE: %v", err)
-			}
-			if err := os.Mkdir("src", 0755); err != nil {
-				t.Fatalf("Failed to create src directory: %v", err)
-			}
-			if err := os.WriteFile("src/main.go", []byte("package main"), 0644); err != nil {
-				t.Fatalf("Failed to create main.go: %v", err)
-			}
+	// Create test files
+	writeTestFiles(t, tempDir, map[string]string{
+		"README.md":   "# Test\nContent",
+		"LICENSE":     "MIT License",
+		"src/main.go": "package main",
+	})
 
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
 			// Update args to use temp file paths
 			for i, arg := range tt.args {
 				if strings.HasSuffix(arg, ".bundle.txt") {
@@ -133,12 +123,7 @@ func TestSaveToBundleFlag(t *testing.T) {
 					t.Errorf("failed to read bundle file: %v", err)
 				}
 
-				contentStr := string(content)
-				for _, expected := range tt.expectedInFile {
-					if !strings.Contains(contentStr, expected) {
-						t.Errorf("bundle file missing expected content: %q\n\nGot:\n%s", expected, contentStr)
-					}
-				}
+				assertOutput(t, string(content), tt.expectedInFile, nil)
 			}
 		})
 	}
@@ -147,25 +132,16 @@ func TestSaveToBundleFlag(t *testing.T) {
 func TestSaveToBundleOverwriteError(t *testing.T) {
 	tempDir := t.TempDir()
 	bundlePath := filepath.Join(tempDir, "existing.bundle.txt")
+	testFile := filepath.Join(tempDir, "test.txt")
 	
-	// Create an existing bundle file
-	if err := os.WriteFile(bundlePath, []byte("existing content"), 0644); err != nil {
-		t.Fatalf("Failed to create existing bundle: %v", err)
-	}
-	
-	oldDir, _ := os.Getwd()
-	defer func() { _ = os.Chdir(oldDir) }()
-	if err := os.Chdir(tempDir); err != nil {
-		t.Fatalf("Failed to change directory: %v", err)
-	}
-	
-	// Create a test file
-	if err := os.WriteFile("test.txt", []byte("test content"), 0644); err != nil {
-		t.Fatalf("Failed to create test file: %v", err)
-	}
+	// Create an existing bundle file and a test file
+	writeTestFiles(t, tempDir, map[string]string{
+		"existing.bundle.txt": "existing content",
+		"test.txt":            "test content",
+	})
 	
 	// Try to save over existing file
-	_, err := executeCommand("test.txt", "--save-to-bundle", bundlePath)
+	_, err := executeCommand(testFile, "--save-to-bundle", bundlePath)
 	
 	if err == nil {
 		t.Error("expected error for existing file, but got none")
@@ -186,20 +162,13 @@ func TestSaveToBundleWithAllFlags(t *testing.T) {
 	tempDir := t.TempDir()
 	bundlePath := filepath.Join(tempDir, "all-flags.bundle.txt")
 
-	oldDir, _ := os.Getwd()
-	defer func() { _ = os.Chdir(oldDir) }()
-	if err := os.Chdir(tempDir); err != nil {
-		t.Fatalf("Failed to change directory: %v", err)
-	}
-
 	// Create test file
-	if err := os.WriteFile("test.txt", []byte("test content"), 0644); err != nil {
-		t.Fatalf("Failed to create test file: %v", err)
-	}
+	writeTestFiles(t, tempDir, map[string]string{"test.txt": "test content"})
+	testFile := filepath.Join(tempDir, "test.txt")
 
 	// Test with all possible flags
 	args := []string{
-		"test.txt",
+		testFile,
 		"--toc",
 		"--linenum", "global",
 		"--theme", "classic-dark",
@@ -7,6 +7,7 @@ import (
 	"path"
 	"sort"
 	"strings"
+	"sync"
 
 	"github.com/spf13/cobra"
 )
@@ -14,6 +15,13 @@ import (
 //go:embed docs
 var docsFS embed.FS
 
+// embeddedTopics lists the topics in docsFS. The embedded tree never changes,
+// so it is walked once and the sorted list is shared by every caller, which
+// must not modify it.
+var embeddedTopics = sync.OnceValues(func() ([]string, error) {
+	return getAvailableTopics(docsFS)
+})
+
 var topicsCmd = &cobra.Command{
 	Use:   "topics [topic-name]",
 	Short: TopicsShort,
@@ -32,7 +40,7 @@ func init() {
 
 // listTopics lists all available documentation topics
 func listTopics(cmd *cobra.Command) error {
-	topics, err := getAvailableTopics()
+	topics, err := embeddedTopics()
 	if err != nil {
 		return fmt.Errorf(ErrFailedToGetTopics, err)
 	}
@@ -86,7 +94,7 @@ func listTopics(cmd *cobra.Command) error {
 // showTopic displays the content of a specific topic
 func showTopic(cmd *cobra.Command, topicName string) error {
 	// Try to find the topic file
-	content, err := findAndReadTopic(topicName)
+	content, err := findAndReadTopic(docsFS, topicName)
 	if err != nil {
 		return fmt.Errorf(ErrTopicNotFound, topicName)
 	}
@@ -95,11 +103,11 @@ func showTopic(cmd *cobra.Command, topicName string) error {
 	return nil
 }
 
-// getAvailableTopics returns a sorted list of all available topics
-func getAvailableTopics() ([]string, error) {
+// getAvailableTopics returns a sorted list of all topics under docs/ in fsys
+func getAvailableTopics(fsys fs.FS) ([]string, error) {
 	topics := []string{}
 
-	err := fs.WalkDir(docsFS, "docs", func(path string, d fs.DirEntry, err error) error {
+	err := fs.WalkDir(fsys, "docs", func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			return err
 		}
@@ -127,8 +135,8 @@ func getAvailableTopics() ([]string, error) {
 	return topics, nil
 }
 
-// findAndReadTopic attempts to find and read a topic file
-func findAndReadTopic(topicName string) (string, error) {
+// findAndReadTopic attempts to find and read a topic file from fsys
+func findAndReadTopic(fsys fs.FS, topicName string) (string, error) {
 	// Clean the topic name
 	topicName = strings.ToLower(strings.ReplaceAll(topicName, "-", "_"))
 
@@ -148,7 +156,7 @@ func findAndReadTopic(topicName string) (string, error) {
 	}
 
 	for _, p := range possiblePaths {
-		content, err := docsFS.ReadFile(p)
+		content, err := fs.ReadFile(fsys, p)
 		if err == nil {
 			return string(content), nil
 		}
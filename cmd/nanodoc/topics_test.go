@@ -0,0 +1,126 @@
+package main
+
+import (
+	"reflect"
+	"testing"
+	"testing/fstest"
+)
+
+// topicsFixture is a small documentation tree shared by the topic tests.
+// Nothing writes to it, so one package-level instance serves every test.
+var topicsFixture = fstest.MapFS{
+	"docs/intro.txt":                  {Data: []byte("Intro topic\n")},
+	"docs/feat/line-numbering.txt":    {Data: []byte("Line numbering topic\n")},
+	"docs/feat/toc.txt":               {Data: []byte("TOC topic\n")},
+	"docs/internal/dev.txt":           {Data: []byte("Internal notes\n")},
+	"docs/examples/sample.bundle.txt": {Data: []byte("example.txt\n")},
+}
+
+func TestGetAvailableTopics(t *testing.T) {
+	got, err := getAvailableTopics(topicsFixture)
+	if err != nil {
+		t.Fatalf("getAvailableTopics() error = %v", err)
+	}
+
+	want := []string{"feat/line-numbering", "feat/toc", "intro"}
+	if !reflect.DeepEqual(got, want) {
+		t.Errorf("getAvailableTopics() = %v, want %v", got, want)
+	}
+}
+
+func TestFindAndReadTopic(t *testing.T) {
+	tests := []struct {
+		name    string
+		topic   string
+		want    string
+		wantErr bool
+	}{
+		{"root topic", "intro", "Intro topic\n", false},
+		{"case insensitive", "INTRO", "Intro topic\n", false},
+		{"grouped topic", "feat/toc", "TOC topic\n", false},
+		{"hyphenated name", "feat/line-numbering", "Line numbering topic\n", false},
+		{"underscored name", "feat/line_numbering", "Line numbering topic\n", false},
+		{"unknown topic", "missing", "", true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, err := findAndReadTopic(topicsFixture, tt.topic)
+			if (err != nil) != tt.wantErr {
+				t.Fatalf("findAndReadTopic(%q) error = %v, wantErr %v", tt.topic, err, tt.wantErr)
+			}
+			if got != tt.want {
+				t.Errorf("findAndReadTopic(%q) = %q, want %q", tt.topic, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestTopicCommands(t *testing.T) {
+	intro, err := docsFS.ReadFile("docs/intro.txt")
+	if err != nil {
+		t.Fatalf("Failed to read embedded intro topic: %v", err)
+	}
+
+	tests := []struct {
+		name           string
+		args           []string
+		wantOutput     []string
+		dontWantOutput []string
+		wantErr        bool
+	}{
+		{
+			name:           "list topics",
+			args:           []string{"topics"},
+			wantOutput:     []string{"intro", "feat:", "line-numbering"},
+			dontWantOutput: []string{"internal", "examples"},
+		},
+		{
+			name:       "show topic",
+			args:       []string{"topics", "intro"},
+			wantOutput: []string{string(intro)},
+		},
+		{
+			name:    "unknown topic",
+			args:    []string{"topics", "no-such-topic"},
+			wantErr: true,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			output, err := executeCommand(tt.args...)
+			if (err != nil) != tt.wantErr {
+				t.Fatalf("executeCommand() error = %v, wantErr %v\nOutput:\n%s", err, tt.wantErr, output)
+			}
+
+			assertOutput(t, output, tt.wantOutput, tt.dontWantOutput)
+		})
+	}
+}
+
+func TestHelpForEachTopic(t *testing.T) {
+	topics, err := embeddedTopics()
+	if err != nil {
+		t.Fatalf("embeddedTopics() error = %v", err)
+	}
+	if len(topics) == 0 {
+		t.Fatal("expected embedded help topics")
+	}
+
+	for _, topic := range topics {
+		t.Run(topic, func(t *testing.T) {
+			content, err := findAndReadTopic(docsFS, topic)
+			if err != nil {
+				t.Fatalf("findAndReadTopic(%q) error = %v", topic, err)
+			}
+
+			output, err := executeCommand("help", topic)
+			if err != nil {
+				t.Fatalf("executeCommand(help %s) error = %v", topic, err)
+			}
+
+			assertOutput(t, output, []string{content}, nil)
+		})
+	}
+}
@@ -513,10 +513,6 @@ This is the intro.`
 		t.Fatalf("Failed to render doc2: %v", err)
 	}
 
-	// Debug output
-	t.Logf("Rendered file 1:\n%s", string(rendered1))
-	t.Logf("Rendered file 2:\n%s", string(rendered2))
-
 	// Combine and generate TOC
 	combined := string(rendered1) + "\n" + string(rendered2)
 	combinedDoc, _ := parser.Parse([]byte(combined))
@@ -528,9 +524,9 @@ This is the intro.`
 		t.Error("No TOC generated")
 	}
 	if !strings.Contains(string(rendered1), "## 1. readme.md") {
-		t.Error("File header not added to file 1")
+		t.Errorf("File header not added to file 1:\n%s", rendered1)
 	}
 	if !strings.Contains(string(rendered1), "## Project Title") {
-		t.Error("H1 not adjusted in file 1")
+		t.Errorf("H1 not adjusted in file 1:\n%s", rendered1)
 	}
 }
\ No newline at end of file
@@ -115,6 +115,21 @@ func applyAlignment(text, alignment string, width int) string {
 	}
 }
 
+// ruledBanner places filename between two rules of ruleChar matching its
+// length. For non-left alignment each line is aligned on its own; the two
+// rules are identical, so they are aligned once and reused rather than
+// joining the block and splitting it back into lines.
+func ruledBanner(filename, ruleChar string, opts *FormattingOptions) string {
+	line := strings.Repeat(ruleChar, len(filename))
+
+	if opts.HeaderAlignment != "left" && opts.HeaderAlignment != "" {
+		line = applyAlignment(line, opts.HeaderAlignment, opts.PageWidth)
+		filename = applyAlignment(filename, opts.HeaderAlignment, opts.PageWidth)
+	}
+
+	return line + "\n" + filename + "\n" + line
+}
+
 // Built-in banner style implementations
 
 // NoneBannerStyle displays just the filename with optional alignment
@@ -135,21 +150,7 @@ func (d DashedBannerStyle) Name() string        { return "dashed" }
 func (d DashedBannerStyle) Description() string { return "Dashed lines above and below" }
 
 func (d DashedBannerStyle) Apply(filename string, opts *FormattingOptions) string {
-	// For dashed/solid styles, we keep the line length matching the text
-	// but apply alignment to the whole block
-	line := strings.Repeat("-", len(filename))
-	block := fmt.Sprintf("%s\n%s\n%s", line, filename, line)
-	
-	// For non-left alignment, we need to align each line
-	if opts.HeaderAlignment != "left" && opts.HeaderAlignment != "" {
-		lines := strings.Split(block, "\n")
-		for i, l := range lines {
-			lines[i] = applyAlignment(l, opts.HeaderAlignment, opts.PageWidth)
-		}
-		return strings.Join(lines, "\n")
-	}
-	
-	return block
+	return ruledBanner(filename, "-", opts)
 }
 
 // SolidBannerStyle uses solid lines above and below
@@ -159,21 +160,7 @@ func (s SolidBannerStyle) Name() string        { return "solid" }
 func (s SolidBannerStyle) Description() string { return "Solid lines above and below" }
 
 func (s SolidBannerStyle) Apply(filename string, opts *FormattingOptions) string {
-	// For dashed/solid styles, we keep the line length matching the text
-	// but apply alignment to the whole block
-	line := strings.Repeat("=", len(filename))
-	block := fmt.Sprintf("%s\n%s\n%s", line, filename, line)
-	
-	// For non-left alignment, we need to align each line
-	if opts.HeaderAlignment != "left" && opts.HeaderAlignment != "" {
-		lines := strings.Split(block, "\n")
-		for i, l := range lines {
-			lines[i] = applyAlignment(l, opts.HeaderAlignment, opts.PageWidth)
-		}
-		return strings.Join(lines, "\n")
-	}
-	
-	return block
+	return ruledBanner(filename, "=", opts)
 }
 
 // BoxedBannerStyle creates a box around the filename
@@ -1,6 +1,7 @@
 package nanodoc
 
 import (
+	"slices"
 	"strings"
 	"testing"
 )
@@ -14,14 +15,7 @@ func TestBannerRegistry(t *testing.T) {
 		
 		// Check all expected styles are present
 		for _, expected := range expectedStyles {
-			found := false
-			for _, registered := range registeredStyles {
-				if registered == expected {
-					found = true
-					break
-				}
-			}
-			if !found {
+			if !slices.Contains(registeredStyles, expected) {
 				t.Errorf("Expected style %q not found in registry", expected)
 			}
 		}
@@ -81,11 +75,7 @@ func TestBannerRegistry(t *testing.T) {
 				
 				result := style.Apply(tt.filename, opts)
 				
-				for _, expected := range tt.contains {
-					if !strings.Contains(result, expected) {
-						t.Errorf("Result does not contain %q\nGot: %s", expected, result)
-					}
-				}
+				assertOutput(t, result, tt.contains, nil)
 			})
 		}
 	})
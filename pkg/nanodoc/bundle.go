@@ -77,6 +77,7 @@ func (bp *BundleProcessor) ProcessBundleFileWithOptions(bundlePath string) (*Bun
 
 	var paths []string
 	var optionLines []string
+	bundleDir := filepath.Dir(bundlePath)
 	scanner := bufio.NewScanner(file)
 
 	for scanner.Scan() {
@@ -96,7 +97,6 @@ func (bp *BundleProcessor) ProcessBundleFileWithOptions(bundlePath string) (*Bun
 		// Handle file paths - make them relative to the bundle file's directory
 		resolvedPath := line
 		if !filepath.IsAbs(line) {
-			bundleDir := filepath.Dir(bundlePath)
 			resolvedPath = filepath.Join(bundleDir, line)
 		}
 
@@ -180,9 +180,10 @@ func BuildDocumentWithOptions(pathInfos []PathInfo, options FormattingOptions) (
 	}
 
 	// Create PathInfo objects for expanded paths, treating them all as files
-	var resolvedInfos []PathInfo
+	resolvedInfos := make([]PathInfo, 0, len(expandedPaths))
+	var resolver absPathResolver
 	for _, path := range expandedPaths {
-		absPath, err := filepath.Abs(path)
+		absPath, err := resolver.Abs(path)
 		if err != nil {
 			return nil, &FileError{Path: path, Err: err}
 		}
@@ -239,41 +240,60 @@ func ExtractBundleOptionLines(pathInfos []PathInfo) ([]string, error) {
 
 // ProcessLiveBundles iterates through document content and processes inline bundles.
 func ProcessLiveBundles(doc *Document) error {
+	// Files included from several items are read once for the whole document
+	files := make(map[string]string)
+
 	for i := range doc.ContentItems {
+		item := &doc.ContentItems[i]
+
+		// Most items carry no directive at all; check that first so the
+		// path-based skip filter below only runs for the few that do
+		if !strings.Contains(item.Content, liveBundleDirective) {
+			continue
+		}
+
 		// Skip processing for common documentation files to avoid processing
 		// [[file:]] examples as actual directives
-		if shouldSkipLiveBundleProcessing(doc.ContentItems[i].Filepath) {
+		if shouldSkipLiveBundleProcessing(item.Filepath) {
 			continue
 		}
-		
-		processedContent, err := ProcessLiveBundle(doc.ContentItems[i].Content)
+
+		processedContent, err := processLiveBundleRecursive(item.Content, 0, make(map[string]bool), files)
 		if err != nil {
 			return err
 		}
-		doc.ContentItems[i].Content = processedContent
+		item.Content = processedContent
 	}
 	return nil
 }
 
+// liveBundleSkipNames lists filename fragments of documentation files that
+// commonly contain [[file:]] examples rather than real directives
+var liveBundleSkipNames = []string{"readme", "changelog", "troubleshooting", "contributing", "license"}
+
 // shouldSkipLiveBundleProcessing determines if a file should be skipped for live bundle processing
 func shouldSkipLiveBundleProcessing(filepath string) bool {
 	// Skip common documentation files that might contain [[file:]] examples
 	filename := strings.ToLower(filepath)
-	return strings.Contains(filename, "readme") ||
-		strings.Contains(filename, "changelog") ||
-		strings.Contains(filename, "troubleshooting") ||
-		strings.Contains(filename, "contributing") ||
-		strings.Contains(filename, "license")
+	for _, name := range liveBundleSkipNames {
+		if strings.Contains(filename, name) {
+			return true
+		}
+	}
+	return false
 }
 
 // ProcessLiveBundle handles inline bundle processing
 // It looks for directives like [[file:path/to/file.txt]] or [[file:path/to/file.txt:L10-20]]
 // and replaces them with the actual file content
 func ProcessLiveBundle(content string) (string, error) {
-	return processLiveBundleRecursive(content, 0, make(map[string]bool))
+	return processLiveBundleRecursive(content, 0, make(map[string]bool), make(map[string]string))
 }
 
-func processLiveBundleRecursive(content string, depth int, visited map[string]bool) (string, error) {
+// processLiveBundleRecursive expands the directives in content. files caches
+// the extracted content of each path (with range) so that a file included
+// repeatedly, at any depth, is only read from disk once.
+func processLiveBundleRecursive(content string, depth int, visited map[string]bool, files map[string]string) (string, error) {
 	// Prevent infinite recursion
 	const maxDepth = 10
 	if depth > maxDepth {
@@ -283,34 +303,37 @@ func processLiveBundleRecursive(content string, depth int, visited map[string]bo
 		}
 	}
 
-	// Process all directives in the content
-	result := content
-	startPos := 0
-	
+	// Process all directives in the content. Output is accumulated in a
+	// single builder: untouched text is copied in slices between directives,
+	// so the cost stays linear in the size of the document.
+	var result strings.Builder
+	copied := 0   // content[:copied] has already been written to result
+	startPos := 0 // where to resume searching for the next directive
+
 	for {
 		// Find the next directive
-		loc := strings.Index(result[startPos:], "[[file:")
+		loc := strings.Index(content[startPos:], liveBundleDirective)
 		if loc == -1 {
 			break
 		}
-		
+
 		// Adjust location to absolute position
 		loc += startPos
-		
+
 		// Find the closing ]]
-		endLoc := strings.Index(result[loc:], "]]")
+		endLoc := strings.Index(content[loc:], "]]")
 		if endLoc == -1 {
 			// Malformed directive, skip it
-			startPos = loc + 7 // len("[[file:")
+			startPos = loc + len(liveBundleDirective)
 			continue
 		}
 		endLoc += loc + 2 // Include the ]]
-		
+
 		// Parse the file path (and optional range)
-		pathStart := loc + 7 // len("[[file:")
+		pathStart := loc + len(liveBundleDirective)
 		pathEnd := endLoc - 2 // Before ]]
-		pathWithRange := result[pathStart:pathEnd]
-		
+		pathWithRange := content[pathStart:pathEnd]
+
 		// Check for circular references
 		if visited[pathWithRange] {
 			return "", &CircularDependencyError{
@@ -318,35 +341,51 @@ func processLiveBundleRecursive(content string, depth int, visited map[string]bo
 				Chain: mapKeysToSlice(visited),
 			}
 		}
-		
+
 		// Mark as visited
 		visited[pathWithRange] = true
-		
+
 		// Extract the file content
-		fileContent, err := ExtractFileContent(pathWithRange)
-		if err != nil {
-			// On error, leave the directive as-is and continue
-			startPos = endLoc
-			continue
+		included, ok := files[pathWithRange]
+		if !ok {
+			fileContent, err := ExtractFileContent(pathWithRange)
+			if err != nil {
+				// On error, leave the directive as-is and continue
+				startPos = endLoc
+				continue
+			}
+			included = fileContent.Content
+			files[pathWithRange] = included
 		}
-		
+
 		// Process nested directives in the included content
-		processedContent, err := processLiveBundleRecursive(fileContent.Content, depth+1, visited)
+		processedContent, err := processLiveBundleRecursive(included, depth+1, visited, files)
 		if err != nil {
 			return "", err
 		}
-		
+
 		// Replace the directive with the content
-		result = result[:loc] + processedContent + result[endLoc:]
-		
+		if copied == 0 {
+			result.Grow(len(content) + len(processedContent))
+		}
+		result.WriteString(content[copied:loc])
+		result.WriteString(processedContent)
+		copied = endLoc
+
 		// Update start position
-		startPos = loc + len(processedContent)
-		
+		startPos = endLoc
+
 		// Remove from visited after processing
 		delete(visited, pathWithRange)
 	}
-	
-	return result, nil
+
+	// No directive was replaced, hand back the input untouched
+	if copied == 0 {
+		return content, nil
+	}
+
+	result.WriteString(content[copied:])
+	return result.String(), nil
 }
 
 // Helper function to convert map keys to slice
@@ -1,7 +1,6 @@
 package nanodoc
 
 import (
-	"os"
 	"path/filepath"
 	"strings"
 	"testing"
@@ -74,51 +73,17 @@ func TestCircularDependencyScenarios(t *testing.T) {
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
 			// Create temp directory
-			tempDir, err := os.MkdirTemp("", "nanodoc-circular-test-*")
-			if err != nil {
-				t.Fatal(err)
-			}
-			defer func() {
-				_ = os.RemoveAll(tempDir)
-			}()
-
-			// Create subdirectory if needed
-			if strings.Contains(tt.name, "nested") {
-				subDir := filepath.Join(tempDir, "sub")
-				if err := os.Mkdir(subDir, 0755); err != nil {
-					t.Fatal(err)
-				}
-			}
+			tempDir := t.TempDir()
 
 			// Set up test files
-			for path, content := range tt.setupFiles {
-				fullPath := filepath.Join(tempDir, path)
-				dir := filepath.Dir(fullPath)
-				if dir != tempDir && dir != "." {
-					if err := os.MkdirAll(dir, 0755); err != nil {
-						t.Fatal(err)
-					}
-				}
-				if err := os.WriteFile(fullPath, []byte(content), 0644); err != nil {
-					t.Fatal(err)
-				}
-			}
+			writeTestFiles(t, tempDir, tt.setupFiles)
 
 			// Change to temp directory for relative path tests
-			oldWd, err := os.Getwd()
-			if err != nil {
-				t.Fatal(err)
-			}
-			defer func() {
-				_ = os.Chdir(oldWd)
-			}()
-			if err := os.Chdir(tempDir); err != nil {
-				t.Fatal(err)
-			}
+			chdir(t, tempDir)
 
 			// Test bundle processing
 			bp := NewBundleProcessor()
-			_, err = bp.ProcessPaths([]string{tt.startFile})
+			_, err := bp.ProcessPaths([]string{tt.startFile})
 
 			if tt.wantErrMsg != "" {
 				// Expecting an error
@@ -188,36 +153,16 @@ func TestLiveBundleCircularScenarios(t *testing.T) {
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
 			// Create temp directory
-			tempDir, err := os.MkdirTemp("", "nanodoc-live-circular-*")
-			if err != nil {
-				t.Fatal(err)
-			}
-			defer func() {
-				_ = os.RemoveAll(tempDir)
-			}()
+			tempDir := t.TempDir()
 
 			// Set up test files
-			for path, content := range tt.setupFiles {
-				fullPath := filepath.Join(tempDir, path)
-				if err := os.WriteFile(fullPath, []byte(content), 0644); err != nil {
-					t.Fatal(err)
-				}
-			}
+			writeTestFiles(t, tempDir, tt.setupFiles)
 
 			// Change to temp directory
-			oldWd, err := os.Getwd()
-			if err != nil {
-				t.Fatal(err)
-			}
-			defer func() {
-				_ = os.Chdir(oldWd)
-			}()
-			if err := os.Chdir(tempDir); err != nil {
-				t.Fatal(err)
-			}
+			chdir(t, tempDir)
 
 			// Test live bundle processing
-			_, err = ProcessLiveBundle(tt.content)
+			_, err := ProcessLiveBundle(tt.content)
 
 			if tt.wantErrMsg != "" {
 				// Expecting an error
@@ -227,6 +172,10 @@ func TestLiveBundleCircularScenarios(t *testing.T) {
 				if !strings.Contains(err.Error(), tt.wantErrMsg) {
 					t.Errorf("Error message %q doesn't contain %q", err.Error(), tt.wantErrMsg)
 				}
+				// Verify it's a CircularDependencyError
+				if _, ok := err.(*CircularDependencyError); !ok {
+					t.Errorf("Expected CircularDependencyError, got %T", err)
+				}
 			} else {
 				// Should succeed
 				if err != nil {
@@ -239,39 +188,19 @@ func TestLiveBundleCircularScenarios(t *testing.T) {
 
 func TestCircularDependencyErrorMessage(t *testing.T) {
 	// Test that error messages are helpful
-	tempDir, err := os.MkdirTemp("", "nanodoc-error-msg-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		_ = os.RemoveAll(tempDir)
-	}()
+	tempDir := t.TempDir()
 
 	// Create circular reference
+	writeTestFiles(t, tempDir, map[string]string{
+		"project.bundle.txt":  "includes.bundle.txt\nREADME.md",
+		"includes.bundle.txt": "project.bundle.txt\nutils.txt",
+	})
 	bundle1 := filepath.Join(tempDir, "project.bundle.txt")
-	bundle2 := filepath.Join(tempDir, "includes.bundle.txt")
-	
-	if err := os.WriteFile(bundle1, []byte("includes.bundle.txt\nREADME.md"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(bundle2, []byte("project.bundle.txt\nutils.txt"), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// Change to temp directory
-	oldWd, err := os.Getwd()
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		_ = os.Chdir(oldWd)
-	}()
-	if err := os.Chdir(tempDir); err != nil {
-		t.Fatal(err)
-	}
 
+	// Bundle entries resolve against the bundle's own directory, so the
+	// absolute bundle path works without changing the working directory
 	bp := NewBundleProcessor()
-	_, err = bp.ProcessPaths([]string{"project.bundle.txt"})
+	_, err := bp.ProcessPaths([]string{bundle1})
 
 	if err == nil {
 		t.Fatal("Expected circular dependency error")
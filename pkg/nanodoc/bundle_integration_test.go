@@ -3,6 +3,7 @@ package nanodoc
 import (
 	"os"
 	"path/filepath"
+	"slices"
 	"strings"
 	"testing"
 )
@@ -10,30 +11,14 @@ import (
 // TestBundleOptionsCompleteIntegration tests the complete bundle options feature from issue #17
 func TestBundleOptionsCompleteIntegration(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-issue17-integration-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files
-	file1 := filepath.Join(tempDir, "file1.txt")
-	file2 := filepath.Join(tempDir, "file2.md")
-	file3 := filepath.Join(tempDir, "config.go")
-	
-	if err := os.WriteFile(file1, []byte("File 1 content\nLine 2"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(file2, []byte("# Header\nMarkdown content"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(file3, []byte("package main\n\nfunc main() {}"), 0644); err != nil {
-		t.Fatal(err)
-	}
+	writeTestFiles(t, tempDir, map[string]string{
+		"file1.txt": "File 1 content\nLine 2",
+		"file2.md":  "# Header\nMarkdown content",
+		"config.go": "package main\n\nfunc main() {}",
+	})
 
 	// Create bundle file with comprehensive options as described in issue #17
 	bundleFile := filepath.Join(tempDir, "test.bundle.txt")
@@ -64,36 +49,36 @@ func TestBundleOptionsCompleteIntegration(t *testing.T) {
 		t.Fatal(err)
 	}
 
-	// Test 1: Bundle options are correctly parsed and applied
-	t.Run("bundle_options_applied", func(t *testing.T) {
-		pathInfos := []PathInfo{
-			{
-				Original: bundleFile,
-				Absolute: bundleFile,
-				Type:     "bundle",
-			},
-		}
-
-		// Options that would be the result of parsing and merging bundle options in CLI
-		// (In real usage, the CLI layer would parse bundle options and merge them)
-		mergedOptions := FormattingOptions{
-			Theme:         "classic-dark",
-			LineNumbers:   LineNumberGlobal,
-			ShowFilenames:   true,
-			HeaderFormat:   HeaderFormatNice,
-			SequenceStyle: SequenceRoman,
-			ShowTOC:       true,
-			AdditionalExtensions: []string{"go"},
-		}
+	pathInfos := []PathInfo{
+		{
+			Original: bundleFile,
+			Absolute: bundleFile,
+			Type:     "bundle",
+		},
+	}
 
-		// Empty explicit flags (not used in new architecture)
-		explicitFlags := make(map[string]bool)
+	// Options that would be the result of parsing and merging bundle options in CLI
+	// (In real usage, the CLI layer would parse bundle options and merge them)
+	bundleOptions := FormattingOptions{
+		Theme:                "classic-dark",
+		LineNumbers:          LineNumberGlobal,
+		ShowFilenames:        true,
+		HeaderFormat:         HeaderFormatNice,
+		SequenceStyle:        SequenceRoman,
+		ShowTOC:              true,
+		AdditionalExtensions: []string{"go"},
+	}
 
-		doc, err := BuildDocumentWithExplicitFlags(pathInfos, mergedOptions, explicitFlags)
-		if err != nil {
-			t.Fatalf("BuildDocumentWithExplicitFlags() error = %v", err)
-		}
+	// The bundle-options document is built once and shared by the subtests
+	// that check its options and its rendering. Explicit flags are empty
+	// (not used in new architecture)
+	doc, err := BuildDocumentWithExplicitFlags(pathInfos, bundleOptions, map[string]bool{})
+	if err != nil {
+		t.Fatalf("BuildDocumentWithExplicitFlags() error = %v", err)
+	}
 
+	// Test 1: Bundle options are correctly parsed and applied
+	t.Run("bundle_options_applied", func(t *testing.T) {
 		// Check that bundle options were applied
 		if doc.FormattingOptions.Theme != "classic-dark" {
 			t.Errorf("Expected theme 'classic-dark', got '%s'", doc.FormattingOptions.Theme)
@@ -112,14 +97,7 @@ func TestBundleOptionsCompleteIntegration(t *testing.T) {
 		}
 		
 		// Check that txt-ext was applied
-		found := false
-		for _, ext := range doc.FormattingOptions.AdditionalExtensions {
-			if ext == "go" {
-				found = true
-				break
-			}
-		}
-		if !found {
+		if !slices.Contains(doc.FormattingOptions.AdditionalExtensions, "go") {
 			t.Error("Expected 'go' extension to be in AdditionalExtensions")
 		}
 
@@ -131,14 +109,6 @@ func TestBundleOptionsCompleteIntegration(t *testing.T) {
 
 	// Test 2: CLI options override bundle options (issue #17 requirement)
 	t.Run("cli_options_override_bundle", func(t *testing.T) {
-		pathInfos := []PathInfo{
-			{
-				Original: bundleFile,
-				Absolute: bundleFile,
-				Type:     "bundle",
-			},
-		}
-
 		// Options that would be the result of CLI flags overriding bundle options
 		// (In real usage, the CLI layer would handle the merging based on explicit flags)
 		mergedOptions := FormattingOptions{
@@ -177,46 +147,13 @@ func TestBundleOptionsCompleteIntegration(t *testing.T) {
 		}
 		
 		// Bundle's txt-ext should still be applied since it wasn't overridden
-		found := false
-		for _, ext := range doc.FormattingOptions.AdditionalExtensions {
-			if ext == "go" {
-				found = true
-				break
-			}
-		}
-		if !found {
+		if !slices.Contains(doc.FormattingOptions.AdditionalExtensions, "go") {
 			t.Error("Expected bundle 'go' extension to still be applied")
 		}
 	})
 
 	// Test 3: Test end-to-end rendering with bundle options
 	t.Run("end_to_end_rendering", func(t *testing.T) {
-		pathInfos := []PathInfo{
-			{
-				Original: bundleFile,
-				Absolute: bundleFile,
-				Type:     "bundle",
-			},
-		}
-
-		// Options that would be the result of parsing bundle options in CLI
-		mergedOptions := FormattingOptions{
-			Theme:         "classic-dark",
-			LineNumbers:   LineNumberGlobal,
-			ShowFilenames:   true,
-			HeaderFormat:   HeaderFormatNice,
-			SequenceStyle: SequenceRoman,
-			ShowTOC:       true,
-			AdditionalExtensions: []string{"go"},
-		}
-
-		explicitFlags := make(map[string]bool)
-
-		doc, err := BuildDocumentWithExplicitFlags(pathInfos, mergedOptions, explicitFlags)
-		if err != nil {
-			t.Fatalf("BuildDocumentWithExplicitFlags() error = %v", err)
-		}
-
 		// Create formatting context and render
 		ctx, err := NewFormattingContext(doc.FormattingOptions)
 		if err != nil {
@@ -229,166 +166,106 @@ func TestBundleOptionsCompleteIntegration(t *testing.T) {
 		}
 
 		// Check that output contains expected elements from bundle options
-		if !strings.Contains(outPut, "Table of Contents") {
-			t.Error("Expected TOC to be present in output")
-		}
-		if !strings.Contains(outPut, "1 |") {
-			t.Error("Expected global line numbers to be present in output")
-		}
-		if !strings.Contains(outPut, "i. File1") {
-			t.Error("Expected roman sequence style in filenames")
-		}
-		if !strings.Contains(outPut, "package main") {
-			t.Error("Expected .go file content to be included due to --ext")
-		}
+		assertOutput(t, outPut, []string{
+			"Table of Contents", // --toc
+			"1 |",               // --linenum global
+			"i. File1",          // --file-numbering roman
+			"package main",      // .go file included due to --ext
+		}, nil)
 	})
 }
 
 // TestBundleOptionsEdgeCases tests edge cases for bundle options
 func TestBundleOptionsEdgeCases(t *testing.T) {
-	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-edge-cases-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
-
-	// Test 1: Bundle with only options, no content
-	t.Run("options_only_bundle", func(t *testing.T) {
-		bundleFile := filepath.Join(tempDir, "options-only.bundle.txt")
-		bundleContent := []string{
+	// All edge-case bundles share one directory, written once
+	tempDir := t.TempDir()
+	writeTestFiles(t, tempDir, map[string]string{
+		"options-only.bundle.txt": strings.Join([]string{
 			"# Options only bundle",
 			"--toc",
 			"--theme classic-dark",
 			"# No content files listed",
-		}
-		if err := os.WriteFile(bundleFile, []byte(strings.Join(bundleContent, "\n")), 0644); err != nil {
-			t.Fatal(err)
-		}
-
-		bp := NewBundleProcessor()
-		result, err := bp.ProcessBundleFileWithOptions(bundleFile)
-		if err != nil {
-			t.Fatalf("ProcessBundleFileWithOptions() error = %v", err)
-		}
-
-		// Should have no paths but option lines should be collected
-		if len(result.Paths) != 0 {
-			t.Errorf("Expected 0 paths, got %d", len(result.Paths))
-		}
-		// Check that option lines were collected
-		expectedOptions := []string{"--toc", "--theme classic-dark"}
-		if len(result.OptionLines) != len(expectedOptions) {
-			t.Errorf("Expected %d option lines, got %d", len(expectedOptions), len(result.OptionLines))
-		}
-		for i, expected := range expectedOptions {
-			if i < len(result.OptionLines) && result.OptionLines[i] != expected {
-				t.Errorf("Expected option line %d to be %q, got %q", i, expected, result.OptionLines[i])
-			}
-		}
-	})
-
-	// Test 2: Bundle with invalid options
-	t.Run("invalid_options", func(t *testing.T) {
-		bundleFile := filepath.Join(tempDir, "invalid-options.bundle.txt")
-		bundleContent := []string{
+		}, "\n"),
+		"invalid-options.bundle.txt": strings.Join([]string{
 			"# Bundle with invalid options",
 			"--invalid-option",
 			"--theme", // Missing value
 			"file1.txt",
-		}
-		if err := os.WriteFile(bundleFile, []byte(strings.Join(bundleContent, "\n")), 0644); err != nil {
-			t.Fatal(err)
-		}
-
-		bp := NewBundleProcessor()
-		result, err := bp.ProcessBundleFileWithOptions(bundleFile)
-		if err != nil {
-			t.Fatalf("Unexpected error: %v", err)
-		}
-		// We should collect both option lines (invalid ones too)
-		expectedOptions := []string{"--invalid-option", "--theme"}
-		if len(result.OptionLines) != len(expectedOptions) {
-			t.Errorf("Expected %d option lines, got %d", len(expectedOptions), len(result.OptionLines))
-		}
-		for i, expected := range expectedOptions {
-			if i < len(result.OptionLines) && result.OptionLines[i] != expected {
-				t.Errorf("Expected option line %d to be %q, got %q", i, expected, result.OptionLines[i])
-			}
-		}
-	})
-
-	// Test 3: Multiple txt-ext options
-	t.Run("multiple_txt_ext", func(t *testing.T) {
-		bundleFile := filepath.Join(tempDir, "multiple-ext.bundle.txt")
-		bundleContent := []string{
+		}, "\n"),
+		"multiple-ext.bundle.txt": strings.Join([]string{
 			"# Multiple txt-ext options",
 			"--ext go",
 			"--ext py",
 			"--ext js",
 			"file1.txt",
-		}
-		if err := os.WriteFile(bundleFile, []byte(strings.Join(bundleContent, "\n")), 0644); err != nil {
-			t.Fatal(err)
-		}
+		}, "\n"),
+	})
 
-		bp := NewBundleProcessor()
-		result, err := bp.ProcessBundleFileWithOptions(bundleFile)
-		if err != nil {
-			t.Fatalf("ProcessBundleFileWithOptions() error = %v", err)
-		}
+	tests := []struct {
+		name        string
+		bundle      string
+		wantPaths   int
+		wantOptions []string
+	}{
+		{
+			// Should have no paths but option lines should be collected
+			name:        "options_only_bundle",
+			bundle:      "options-only.bundle.txt",
+			wantPaths:   0,
+			wantOptions: []string{"--toc", "--theme classic-dark"},
+		},
+		{
+			// We should collect both option lines (invalid ones too)
+			name:        "invalid_options",
+			bundle:      "invalid-options.bundle.txt",
+			wantPaths:   1,
+			wantOptions: []string{"--invalid-option", "--theme"},
+		},
+		{
+			// Should have all three extension option lines
+			name:        "multiple_txt_ext",
+			bundle:      "multiple-ext.bundle.txt",
+			wantPaths:   1,
+			wantOptions: []string{"--ext go", "--ext py", "--ext js"},
+		},
+	}
 
-		// Should have all three extension option lines
-		expectedOptions := []string{"--ext go", "--ext py", "--ext js"}
-		if len(result.OptionLines) != len(expectedOptions) {
-			t.Errorf("Expected %d option lines, got %d", len(expectedOptions), len(result.OptionLines))
-		}
-		for i, expected := range expectedOptions {
-			if i < len(result.OptionLines) && result.OptionLines[i] != expected {
-				t.Errorf("Expected option line %d to be %q, got %q", i, expected, result.OptionLines[i])
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			bp := NewBundleProcessor()
+			result, err := bp.ProcessBundleFileWithOptions(filepath.Join(tempDir, tt.bundle))
+			if err != nil {
+				t.Fatalf("ProcessBundleFileWithOptions() error = %v", err)
 			}
-		}
-	})
+
+			if len(result.Paths) != tt.wantPaths {
+				t.Errorf("Expected %d paths, got %d", tt.wantPaths, len(result.Paths))
+			}
+			if len(result.OptionLines) != len(tt.wantOptions) {
+				t.Errorf("Expected %d option lines, got %d", len(tt.wantOptions), len(result.OptionLines))
+			}
+			for i, expected := range tt.wantOptions {
+				if i < len(result.OptionLines) && result.OptionLines[i] != expected {
+					t.Errorf("Expected option line %d to be %q, got %q", i, expected, result.OptionLines[i])
+				}
+			}
+		})
+	}
 }
 
 // TestBundleOptionsDocumentationExample tests the exact example from the issue #17 documentation
 func TestBundleOptionsDocumentationExample(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-doc-example-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files mentioned in the documentation
+	writeTestFiles(t, tempDir, map[string]string{
+		"README.md":           "# My Project\nDocumentation",
+		"docs/design.md":      "# Design\nArchitecture",
+		"pkg/nanodoc/main.go": "package main\n\nfunc main() {}",
+	})
 	readmeFile := filepath.Join(tempDir, "README.md")
 	docsDir := filepath.Join(tempDir, "docs")
-	pkgDir := filepath.Join(tempDir, "pkg", "nanodoc")
-	
-	if err := os.MkdirAll(docsDir, 0755); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.MkdirAll(pkgDir, 0755); err != nil {
-		t.Fatal(err)
-	}
-	
-	if err := os.WriteFile(readmeFile, []byte("# My Project\nDocumentation"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(filepath.Join(docsDir, "design.md"), []byte("# Design\nArchitecture"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(filepath.Join(pkgDir, "main.go"), []byte("package main\n\nfunc main() {}"), 0644); err != nil {
-		t.Fatal(err)
-	}
 
 	// Create the exact bundle file from the issue #17 documentation
 	bundleFile := filepath.Join(tempDir, "bundle.txt")
@@ -449,8 +326,8 @@ func TestBundleOptionsDocumentationExample(t *testing.T) {
 	
 	// Expected paths (relative to bundle file)
 	expectedPaths := []string{
-		filepath.Join(tempDir, "README.md"),
-		filepath.Join(tempDir, "docs"),
+		readmeFile,
+		docsDir,
 		filepath.Join(tempDir, "pkg/nanodoc/*.go"),
 	}
 	
@@ -464,15 +341,7 @@ func TestBundleOptionsDocumentationExample(t *testing.T) {
 // Test that bundle options are correctly extracted from a list of PathInfo
 func TestExtractBundleOptionLines(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-extract-options-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create two bundle files with different options
 	bundle1 := filepath.Join(tempDir, "bundle1.bundle.txt")
@@ -521,14 +390,7 @@ func TestExtractBundleOptionLines(t *testing.T) {
 	
 	// Check that the options are present (order might vary)
 	for _, expected := range expectedOptions {
-		found := false
-		for _, actual := range optionLines {
-			if actual == expected {
-				found = true
-				break
-			}
-		}
-		if !found {
+		if !slices.Contains(optionLines, expected) {
 			t.Errorf("Expected option %q not found in extracted lines", expected)
 		}
 	}
@@ -9,29 +9,18 @@ import (
 
 func TestBundlePreservesFileOrder(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-bundle-order-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		_ = os.RemoveAll(tempDir)
-	}()
-
-	// Create test files with names that would sort differently alphabetically
+	tempDir := t.TempDir()
+
+	// Create test files with names that would sort differently alphabetically,
+	// each with distinct content
+	writeTestFiles(t, tempDir, map[string]string{
+		"z-file.txt": "Content Z",
+		"a-file.txt": "Content A",
+		"m-file.txt": "Content M",
+	})
 	fileZ := filepath.Join(tempDir, "z-file.txt")
 	fileA := filepath.Join(tempDir, "a-file.txt")
 	fileM := filepath.Join(tempDir, "m-file.txt")
-	
-	// Write distinct content to each file
-	if err := os.WriteFile(fileZ, []byte("Content Z"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(fileA, []byte("Content A"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(fileM, []byte("Content M"), 0644); err != nil {
-		t.Fatal(err)
-	}
 
 	// Create bundle file with specific order: Z, A, M
 	bundleFile := filepath.Join(tempDir, "test.bundle.txt")
@@ -89,13 +78,7 @@ func TestBundlePreservesFileOrder(t *testing.T) {
 
 func TestBundleWithMixedSourcesPreservesOrder(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-bundle-mixed-order-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		_ = os.RemoveAll(tempDir)
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files
 	file1 := filepath.Join(tempDir, "1-file.txt")
@@ -104,18 +87,12 @@ func TestBundleWithMixedSourcesPreservesOrder(t *testing.T) {
 	file4 := filepath.Join(tempDir, "4-file.txt")
 	
 	// Write distinct content
-	files := map[string]string{
-		file1: "Content 1",
-		file2: "Content 2",
-		file3: "Content 3",
-		file4: "Content 4",
-	}
-	
-	for file, content := range files {
-		if err := os.WriteFile(file, []byte(content), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
+	writeTestFiles(t, tempDir, map[string]string{
+		"1-file.txt": "Content 1",
+		"2-file.txt": "Content 2",
+		"3-file.txt": "Content 3",
+		"4-file.txt": "Content 4",
+	})
 
 	// Create bundle with files 3 and 1
 	bundleFile := filepath.Join(tempDir, "test.bundle.txt")
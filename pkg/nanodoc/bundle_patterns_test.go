@@ -19,16 +19,7 @@ func TestBundleWithPatterns(t *testing.T) {
 		"README.md":         "# README",
 	}
 	
-	for path, content := range testFiles {
-		fullPath := filepath.Join(tmpDir, path)
-		dir := filepath.Dir(fullPath)
-		if err := os.MkdirAll(dir, 0755); err != nil {
-			t.Fatal(err)
-		}
-		if err := os.WriteFile(fullPath, []byte(content), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
+	writeTestFiles(t, tmpDir, testFiles)
 	
 	// Create bundle file with patterns
 	bundleContent := `# Bundle with patterns
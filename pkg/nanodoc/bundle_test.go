@@ -9,35 +9,15 @@ import (
 
 func TestProcessBundleFile(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-bundle-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files
+	writeTestFiles(t, tempDir, map[string]string{
+		"file1.txt":        "content1",
+		"file2.txt":        "content2",
+		"subdir/file3.txt": "content3",
+	})
 	file1 := filepath.Join(tempDir, "file1.txt")
-	file2 := filepath.Join(tempDir, "file2.txt")
-	subDir := filepath.Join(tempDir, "subdir")
-	file3 := filepath.Join(subDir, "file3.txt")
-
-	// Create files and directories
-	if err := os.WriteFile(file1, []byte("content1"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(file2, []byte("content2"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.Mkdir(subDir, 0755); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(file3, []byte("content3"), 0644); err != nil {
-		t.Fatal(err)
-	}
 
 	// Create bundle file with various types of entries
 	bundleFile := filepath.Join(tempDir, "test.bundle.txt")
@@ -70,7 +50,7 @@ func TestProcessBundleFile(t *testing.T) {
 
 	// Check that relative paths were resolved correctly
 	expectedPaths := []string{
-		filepath.Join(tempDir, "file1.txt"),
+		file1,
 		filepath.Join(tempDir, "file2.txt"),
 		filepath.Join(tempDir, "subdir/file3.txt"),
 		file1, // Absolute path should remain as-is
@@ -83,84 +63,19 @@ func TestProcessBundleFile(t *testing.T) {
 	}
 }
 
-func TestCircularDependencyDetection(t *testing.T) {
-	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-circular-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
-
-	// Create bundle files that reference each other
-	bundle1 := filepath.Join(tempDir, "bundle1.bundle.txt")
-	bundle2 := filepath.Join(tempDir, "bundle2.bundle.txt")
-	bundle3 := filepath.Join(tempDir, "bundle3.bundle.txt")
-
-	// bundle1 -> bundle2
-	if err := os.WriteFile(bundle1, []byte("bundle2.bundle.txt"), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// bundle2 -> bundle3
-	if err := os.WriteFile(bundle2, []byte("bundle3.bundle.txt"), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// bundle3 -> bundle1 (creates cycle)
-	if err := os.WriteFile(bundle3, []byte("bundle1.bundle.txt"), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// Test circular dependency detection
-	bp := NewBundleProcessor()
-	_, err = bp.ProcessPaths([]string{bundle1})
-
-	if err == nil {
-		t.Fatal("Expected circular dependency error, got nil")
-	}
-
-	// Check that it's a CircularDependencyError
-	if _, ok := err.(*CircularDependencyError); !ok {
-		t.Errorf("Expected CircularDependencyError, got %T", err)
-	}
-}
-
 func TestProcessPaths(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-processpaths-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
-
-	// Create test files
+	tempDir := t.TempDir()
+
+	// Create test files and a bundle file
+	writeTestFiles(t, tempDir, map[string]string{
+		"file1.txt":       "content",
+		"file2.txt":       "content",
+		"file3.txt":       "content",
+		"test.bundle.txt": "file2.txt\nfile3.txt",
+	})
 	file1 := filepath.Join(tempDir, "file1.txt")
-	file2 := filepath.Join(tempDir, "file2.txt")
-	file3 := filepath.Join(tempDir, "file3.txt")
-
-	for _, file := range []string{file1, file2, file3} {
-		if err := os.WriteFile(file, []byte("content"), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
-
-	// Create a bundle file
 	bundle := filepath.Join(tempDir, "test.bundle.txt")
-	bundleContent := []string{
-		"file2.txt",
-		"file3.txt",
-	}
-	if err := os.WriteFile(bundle, []byte(strings.Join(bundleContent, "\n")), 0644); err != nil {
-		t.Fatal(err)
-	}
 
 	// Test processing mixed paths
 	bp := NewBundleProcessor()
@@ -178,47 +93,19 @@ func TestProcessPaths(t *testing.T) {
 
 func TestNestedBundles(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-nested-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
-
-	// Create test files
-	file1 := filepath.Join(tempDir, "file1.txt")
-	file2 := filepath.Join(tempDir, "file2.txt")
-	file3 := filepath.Join(tempDir, "file3.txt")
-
-	for _, file := range []string{file1, file2, file3} {
-		if err := os.WriteFile(file, []byte("content"), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
-
-	// Create nested bundles
-	// inner.bundle.txt contains file2.txt and file3.txt
-	innerBundle := filepath.Join(tempDir, "inner.bundle.txt")
-	innerContent := []string{
-		"file2.txt",
-		"file3.txt",
-	}
-	if err := os.WriteFile(innerBundle, []byte(strings.Join(innerContent, "\n")), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// outer.bundle.txt contains file1.txt and inner.bundle.txt
+	tempDir := t.TempDir()
+
+	// Create test files and nested bundles
+	writeTestFiles(t, tempDir, map[string]string{
+		"file1.txt": "content",
+		"file2.txt": "content",
+		"file3.txt": "content",
+		// inner.bundle.txt contains file2.txt and file3.txt
+		"inner.bundle.txt": "file2.txt\nfile3.txt",
+		// outer.bundle.txt contains file1.txt and inner.bundle.txt
+		"outer.bundle.txt": "file1.txt\ninner.bundle.txt",
+	})
 	outerBundle := filepath.Join(tempDir, "outer.bundle.txt")
-	outerContent := []string{
-		"file1.txt",
-		"inner.bundle.txt",
-	}
-	if err := os.WriteFile(outerBundle, []byte(strings.Join(outerContent, "\n")), 0644); err != nil {
-		t.Fatal(err)
-	}
 
 	// Test processing nested bundles
 	bp := NewBundleProcessor()
@@ -235,32 +122,16 @@ func TestNestedBundles(t *testing.T) {
 
 func TestBuildDocument(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-builddoc-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
-
-	// Create test files
+	tempDir := t.TempDir()
+
+	// Create test files and a bundle file
+	writeTestFiles(t, tempDir, map[string]string{
+		"file1.txt":       "File 1 content\nLine 2",
+		"file2.txt":       "File 2 content",
+		"test.bundle.txt": "file2.txt",
+	})
 	file1 := filepath.Join(tempDir, "file1.txt")
-	file2 := filepath.Join(tempDir, "file2.txt")
-
-	if err := os.WriteFile(file1, []byte("File 1 content\nLine 2"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(file2, []byte("File 2 content"), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// Create a bundle file
 	bundle := filepath.Join(tempDir, "test.bundle.txt")
-	if err := os.WriteFile(bundle, []byte("file2.txt"), 0644); err != nil {
-		t.Fatal(err)
-	}
 
 	// Test building document with mixed inputs
 	pathInfos := []PathInfo{
@@ -304,15 +175,7 @@ func TestBuildDocument(t *testing.T) {
 
 func TestEmptyBundle(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-empty-bundle-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create empty bundle file
 	emptyBundle := filepath.Join(tempDir, "empty.bundle.txt")
@@ -334,15 +197,7 @@ func TestEmptyBundle(t *testing.T) {
 
 func TestBundleWithMissingFile(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-missing-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create bundle referencing non-existent file
 	bundle := filepath.Join(tempDir, "test.bundle.txt")
@@ -363,119 +218,50 @@ func TestBundleWithMissingFile(t *testing.T) {
 	}
 }
 
-func TestBundleOptions(t *testing.T) {
-	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-bundle-options-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
-
-	// Create test files
-	file1 := filepath.Join(tempDir, "file1.txt")
-	file2 := filepath.Join(tempDir, "file2.txt")
-	
-	if err := os.WriteFile(file1, []byte("Content of file 1"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(file2, []byte("Content of file 2"), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// Create bundle file with options
-	bundleFile := filepath.Join(tempDir, "test.bundle.txt")
-	bundleContent := []string{
-		"# Bundle with options",
-		"--toc",
-		"--theme classic-dark",
-		"--header-format filename",
-		"--file-numbering roman",
-		"--linenum global",
-		"--ext log",
-		"",
-		"# Files to include",
-		"file1.txt",
-		"file2.txt",
-	}
-	if err := os.WriteFile(bundleFile, []byte(strings.Join(bundleContent, "\n")), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// Test parsing bundle options
-	bp := NewBundleProcessor()
-	result, err := bp.ProcessBundleFileWithOptions(bundleFile)
-	if err != nil {
-		t.Fatalf("ProcessBundleFileWithOptions() error = %v", err)
-	}
-
-	// Check that option lines were collected correctly
-	expectedOptions := []string{
-		"--toc",
-		"--theme classic-dark",
-		"--header-format filename",
-		"--file-numbering roman",
-		"--linenum global",
-		"--ext log",
-	}
-	if len(result.OptionLines) != len(expectedOptions) {
-		t.Errorf("Expected %d option lines, got %d", len(expectedOptions), len(result.OptionLines))
-	}
-	for i, expected := range expectedOptions {
-		if i < len(result.OptionLines) && result.OptionLines[i] != expected {
-			t.Errorf("Expected option line %d to be %q, got %q", i, expected, result.OptionLines[i])
-		}
-	}
-
-	// Check that file paths were parsed correctly
-	if len(result.Paths) != 2 {
-		t.Errorf("Expected 2 paths, got %d", len(result.Paths))
-	}
-}
-
 
 func TestProcessLiveBundle(t *testing.T) {
+	// The included files never collide and are only read, so every case
+	// shares one fixture directory instead of building its own
+	tempDir := t.TempDir()
+	writeTestFiles(t, tempDir, map[string]string{
+		"test.txt": "Included content",
+		// file1.txt includes file2.txt, which has the final content
+		"file1.txt": "File 1 start\n[[file:file2.txt]]\nFile 1 end",
+		"file2.txt": "File 2 content",
+		"a.txt":     "A",
+		"b.txt":     "B",
+	})
+
+	// Change to temp directory to resolve relative paths
+	chdir(t, tempDir)
+
 	tests := []struct {
-		name      string
-		content   string
-		setupFunc func(string) error
-		want      string
-		wantErr   bool
+		name    string
+		content string
+		want    string
+		wantErr bool
 	}{
 		{
 			name: "simple_live_bundle",
 			content: "This is a test document.\nHere we include a file: [[file:test.txt]]\nAnd here is more text.",
-			setupFunc: func(tempDir string) error {
-				return os.WriteFile(filepath.Join(tempDir, "test.txt"), []byte("Included content"), 0644)
-			},
 			want: "This is a test document.\nHere we include a file: Included content\nAnd here is more text.",
 			wantErr: false,
 		},
 		{
 			name: "nested_live_bundle",
 			content: "Main document\n[[file:file1.txt]]\nEnd of main",
-			setupFunc: func(tempDir string) error {
-				// file1.txt includes file2.txt
-				if err := os.WriteFile(filepath.Join(tempDir, "file1.txt"), 
-					[]byte("File 1 start\n[[file:file2.txt]]\nFile 1 end"), 0644); err != nil {
-					return err
-				}
-				// file2.txt has final content
-				return os.WriteFile(filepath.Join(tempDir, "file2.txt"), 
-					[]byte("File 2 content"), 0644)
-			},
 			want: "Main document\nFile 1 start\nFile 2 content\nFile 1 end\nEnd of main",
 			wantErr: false,
 		},
+		{
+			name: "multiple_live_bundles",
+			content: "[[file:a.txt]] and [[file:b.txt]], then [[file:a.txt]] again [[file:",
+			want:    "A and B, then A again [[file:",
+			wantErr: false,
+		},
 		{
 			name: "non-existent_bundle",
 			content: `Document with missing file: [[file:missing.txt]]`,
-			setupFunc: func(tempDir string) error {
-				return nil
-			},
 			want:    `Document with missing file: [[file:missing.txt]]`,
 			wantErr: false, // Should leave directive as-is
 		},
@@ -483,38 +269,6 @@ func TestProcessLiveBundle(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			// Create temp directory
-			tempDir, err := os.MkdirTemp("", "nanodoc-live-test-*")
-			if err != nil {
-				t.Fatal(err)
-			}
-			defer func() {
-				if err := os.RemoveAll(tempDir); err != nil {
-					t.Logf("Failed to remove temp dir: %v", err)
-				}
-			}()
-
-			// Change to temp directory to resolve relative paths
-			oldDir, err := os.Getwd()
-			if err != nil {
-				t.Fatal(err)
-			}
-			if err := os.Chdir(tempDir); err != nil {
-				t.Fatal(err)
-			}
-			defer func() {
-				if err := os.Chdir(oldDir); err != nil {
-					t.Logf("Failed to change back to original dir: %v", err)
-				}
-			}()
-
-			// Run setup function
-			if tt.setupFunc != nil {
-				if err := tt.setupFunc(tempDir); err != nil {
-					t.Fatal(err)
-				}
-			}
-
 			got, err := ProcessLiveBundle(tt.content)
 			if (err != nil) != tt.wantErr {
 				t.Errorf("ProcessLiveBundle() error = %v, wantErr %v", err, tt.wantErr)
@@ -527,17 +281,38 @@ func TestProcessLiveBundle(t *testing.T) {
 	}
 }
 
-func TestProcessLiveBundleWithRanges(t *testing.T) {
-	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-live-range-test-*")
-	if err != nil {
+func TestProcessLiveBundles(t *testing.T) {
+	tempDir := t.TempDir()
+	included := filepath.Join(tempDir, "included.txt")
+	if err := os.WriteFile(included, []byte("Included"), 0644); err != nil {
 		t.Fatal(err)
 	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
+	directive := "[[file:" + included + "]]"
+
+	doc := &Document{
+		ContentItems: []FileContent{
+			{Filepath: filepath.Join(tempDir, "plain.txt"), Content: "no directives here"},
+			{Filepath: filepath.Join(tempDir, "doc.txt"), Content: "See " + directive},
+			{Filepath: filepath.Join(tempDir, "README.md"), Content: "Example: " + directive},
+			{Filepath: filepath.Join(tempDir, "again.txt"), Content: directive + " twice " + directive},
+		},
+	}
+
+	if err := ProcessLiveBundles(doc); err != nil {
+		t.Fatalf("ProcessLiveBundles() error = %v", err)
+	}
+
+	want := []string{"no directives here", "See Included", "Example: " + directive, "Included twice Included"}
+	for i, w := range want {
+		if got := doc.ContentItems[i].Content; got != w {
+			t.Errorf("ContentItems[%d].Content = %q, want %q", i, got, w)
 		}
-	}()
+	}
+}
+
+func TestProcessLiveBundleWithRanges(t *testing.T) {
+	// Create temp directory
+	tempDir := t.TempDir()
 
 	// Create a file with multiple lines
 	testFile := filepath.Join(tempDir, "multiline.txt")
@@ -553,18 +328,7 @@ func TestProcessLiveBundleWithRanges(t *testing.T) {
 	}
 
 	// Change to temp directory
-	oldDir, err := os.Getwd()
-	if err != nil {
-		t.Fatal(err)
-	}
-	if err := os.Chdir(tempDir); err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.Chdir(oldDir); err != nil {
-			t.Logf("Failed to change back to original dir: %v", err)
-		}
-	}()
+	chdir(t, tempDir)
 
 	// Test with range
 	input := `Include lines 2-4: [[file:multiline.txt:L2-4]]`
@@ -579,149 +343,113 @@ func TestProcessLiveBundleWithRanges(t *testing.T) {
 	}
 }
 
-func TestProcessLiveBundleCircularReference(t *testing.T) {
-	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-live-circular-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
-
-	// Create files that reference each other
-	file1 := filepath.Join(tempDir, "file1.txt")
-	file2 := filepath.Join(tempDir, "file2.txt")
-
-	// file1 includes file2
-	if err := os.WriteFile(file1, []byte("File 1\n[[file:file2.txt]]"), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// file2 includes file1 (circular)
-	if err := os.WriteFile(file2, []byte("File 2\n[[file:file1.txt]]"), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// Change to temp directory
-	oldDir, err := os.Getwd()
-	if err != nil {
-		t.Fatal(err)
-	}
-	if err := os.Chdir(tempDir); err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.Chdir(oldDir); err != nil {
-			t.Logf("Failed to change back to original dir: %v", err)
-		}
-	}()
-
-	// Test circular reference detection
-	_, err = ProcessLiveBundle("Start\n[[file:file1.txt]]\nEnd")
-	if err == nil {
-		t.Fatal("Expected circular dependency error, got nil")
-	}
-
-	// Check that it's a CircularDependencyError
-	if _, ok := err.(*CircularDependencyError); !ok {
-		t.Errorf("Expected CircularDependencyError, got %T", err)
-	}
-}
-
 
 func TestProcessBundleFileWithOptions(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-bundle-options-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files
-	file1 := filepath.Join(tempDir, "file1.txt")
-	file2 := filepath.Join(tempDir, "file2.txt")
-	
-	if err := os.WriteFile(file1, []byte("content1"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(file2, []byte("content2"), 0644); err != nil {
-		t.Fatal(err)
-	}
+	writeTestFiles(t, tempDir, map[string]string{
+		"file1.txt": "content1",
+		"file2.txt": "content2",
+	})
 
-	// Create bundle file with options and file paths
-	bundleFile := filepath.Join(tempDir, "test.bundle.txt")
-	bundleContent := []string{
-		"# My Project Documentation Bundle",
-		"#",
-		"# This bundle defines both formatting options and the content to include.",
-		"",
-		"# --- Options ---",
-		"--toc",
-		"--linenum global",
-		"--header-format nice",
-		"--file-numbering roman",
-		"--theme classic-dark",
-		"--ext go",
-		"--ext py",
-		"",
-		"# --- Content ---",
-		"file1.txt",
-		"file2.txt",
-	}
-	if err := os.WriteFile(bundleFile, []byte(strings.Join(bundleContent, "\n")), 0644); err != nil {
-		t.Fatal(err)
+	tests := []struct {
+		name          string
+		bundleContent []string
+		wantOptions   []string
+	}{
+		{
+			name: "options before files",
+			bundleContent: []string{
+				"# Bundle with options",
+				"--toc",
+				"--theme classic-dark",
+				"--header-format filename",
+				"--file-numbering roman",
+				"--linenum global",
+				"--ext log",
+				"",
+				"# Files to include",
+				"file1.txt",
+				"file2.txt",
+			},
+			wantOptions: []string{
+				"--toc",
+				"--theme classic-dark",
+				"--header-format filename",
+				"--file-numbering roman",
+				"--linenum global",
+				"--ext log",
+			},
+		},
+		{
+			name: "commented sections and repeated flags",
+			bundleContent: []string{
+				"# My Project Documentation Bundle",
+				"#",
+				"# This bundle defines both formatting options and the content to include.",
+				"",
+				"# --- Options ---",
+				"--toc",
+				"--linenum global",
+				"--header-format nice",
+				"--file-numbering roman",
+				"--theme classic-dark",
+				"--ext go",
+				"--ext py",
+				"",
+				"# --- Content ---",
+				"file1.txt",
+				"file2.txt",
+			},
+			wantOptions: []string{
+				"--toc",
+				"--linenum global",
+				"--header-format nice",
+				"--file-numbering roman",
+				"--theme classic-dark",
+				"--ext go",
+				"--ext py",
+			},
+		},
 	}
 
-	// Test processing the bundle file with options
-	bp := NewBundleProcessor()
-	result, err := bp.ProcessBundleFileWithOptions(bundleFile)
-	if err != nil {
-		t.Fatalf("ProcessBundleFileWithOptions() error = %v", err)
-	}
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			// Each case gets its own bundle file next to the shared files
+			bundleFile := filepath.Join(tempDir, strings.ReplaceAll(tt.name, " ", "-")+".bundle.txt")
+			if err := os.WriteFile(bundleFile, []byte(strings.Join(tt.bundleContent, "\n")), 0644); err != nil {
+				t.Fatal(err)
+			}
 
-	// Check paths
-	if len(result.Paths) != 2 {
-		t.Errorf("Expected 2 paths, got %d", len(result.Paths))
-	}
+			bp := NewBundleProcessor()
+			result, err := bp.ProcessBundleFileWithOptions(bundleFile)
+			if err != nil {
+				t.Fatalf("ProcessBundleFileWithOptions() error = %v", err)
+			}
 
-	// Check option lines
-	expectedOptions := []string{
-		"--toc",
-		"--linenum global",
-		"--header-format nice",
-		"--file-numbering roman",
-		"--theme classic-dark",
-		"--ext go",
-		"--ext py",
-	}
-	if len(result.OptionLines) != len(expectedOptions) {
-		t.Errorf("Expected %d option lines, got %d", len(expectedOptions), len(result.OptionLines))
-	}
-	for i, expected := range expectedOptions {
-		if i < len(result.OptionLines) && result.OptionLines[i] != expected {
-			t.Errorf("Expected option line %d to be %q, got %q", i, expected, result.OptionLines[i])
-		}
+			// Check paths
+			if len(result.Paths) != 2 {
+				t.Errorf("Expected 2 paths, got %d", len(result.Paths))
+			}
+
+			// Check option lines
+			if len(result.OptionLines) != len(tt.wantOptions) {
+				t.Errorf("Expected %d option lines, got %d", len(tt.wantOptions), len(result.OptionLines))
+			}
+			for i, expected := range tt.wantOptions {
+				if i < len(result.OptionLines) && result.OptionLines[i] != expected {
+					t.Errorf("Expected option line %d to be %q, got %q", i, expected, result.OptionLines[i])
+				}
+			}
+		})
 	}
 }
 
 func TestBundleOptionsIntegration(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-integration-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files
 	file1 := filepath.Join(tempDir, "file1.txt")
@@ -773,15 +501,7 @@ func TestBundleOptionsIntegration(t *testing.T) {
 
 func TestEndToEndBundleOptions(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-e2e-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files
 	file1 := filepath.Join(tempDir, "intro.txt")
@@ -916,28 +636,16 @@ func TestEndToEndBundleOptions(t *testing.T) {
 	}
 
 	// Verify output contains expected elements based on bundle options
-	if !strings.Contains(output, "Table of Contents") {
-		t.Error("Expected output to contain 'Table of Contents' due to --toc option")
-	}
-	if !strings.Contains(output, "i. Intro") {
-		t.Error("Expected output to contain 'i. Intro' due to --file-numbering roman option")
-	}
-	if !strings.Contains(output, "1 |") {
-		t.Error("Expected output to contain line numbers due to --linenum global option")
-	}
+	assertOutput(t, output, []string{
+		"Table of Contents", // --toc
+		"i. Intro",          // --file-numbering roman
+		"1 |",               // --linenum global
+	}, nil)
 }
 
 func TestBuildDocumentWithExplicitFlags(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-explicit-flags-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files
 	file1 := filepath.Join(tempDir, "file1.txt")
@@ -6,6 +6,9 @@ var DefaultTextExtensions = []string{".txt", ".md"}
 // Bundle file pattern
 const BundlePattern = ".bundle."
 
+// Opening marker of an inline live bundle directive ([[file:path]])
+const liveBundleDirective = "[[file:"
+
 // LineNumberMode represents different line numbering modes
 type LineNumberMode int
 
@@ -1,8 +1,9 @@
 package nanodoc
 
 import (
-	"bufio"
+	"bytes"
 	"fmt"
+	"io"
 	"os"
 	"path/filepath"
 	"sort"
@@ -42,6 +43,8 @@ func GenerateDryRunInfo(pathInfos []PathInfo, opts FormattingOptions) (*DryRunIn
 		RequiresExtension: make(map[string]string),
 		Options:           opts,
 	}
+	counts := make(lineCounts)
+	textExts := newTextExtensionSet(opts.AdditionalExtensions)
 
 	// Process each path
 	for _, pathInfo := range pathInfos {
@@ -59,7 +62,7 @@ func GenerateDryRunInfo(pathInfos []PathInfo, opts FormattingOptions) (*DryRunIn
 			}
 			
 			// Count lines in the file
-			lineCount, err := countFileLines(pathInfo.Original)
+			lineCount, err := counts.countFileLines(pathInfo.Original)
 			if err != nil {
 				return nil, err
 			}
@@ -67,7 +70,7 @@ func GenerateDryRunInfo(pathInfos []PathInfo, opts FormattingOptions) (*DryRunIn
 			info.TotalLines += lineCount
 			
 			// Check if file needs additional extension
-			if !isTextFileWithExtensions(pathInfo.Absolute, opts.AdditionalExtensions) {
+			if !textExts.contains(pathInfo.Absolute) {
 				info.RequiresExtension[pathInfo.Absolute] = ext
 			}
 			
@@ -82,7 +85,7 @@ func GenerateDryRunInfo(pathInfos []PathInfo, opts FormattingOptions) (*DryRunIn
 				}
 				
 				// Count lines in the file
-				lineCount, err := countFileLines(file)
+				lineCount, err := counts.countFileLines(file)
 				if err != nil {
 					return nil, err
 				}
@@ -101,7 +104,7 @@ func GenerateDryRunInfo(pathInfos []PathInfo, opts FormattingOptions) (*DryRunIn
 				}
 				
 				// Count lines in the file
-				lineCount, err := countFileLines(file)
+				lineCount, err := counts.countFileLines(file)
 				if err != nil {
 					return nil, err
 				}
@@ -133,7 +136,7 @@ func GenerateDryRunInfo(pathInfos []PathInfo, opts FormattingOptions) (*DryRunIn
 				fileInfo.RangeSpec = rangeSpec
 				
 				// Count lines in the file
-				lineCount, err := countFileLines(bundlePath)
+				lineCount, err := counts.countFileLines(bundlePath)
 				if err != nil {
 					// Skip files that can't be read
 					continue
@@ -146,9 +149,8 @@ func GenerateDryRunInfo(pathInfos []PathInfo, opts FormattingOptions) (*DryRunIn
 		}
 	}
 	
-	// Remove duplicates and sort
-	info.Bundles = uniqueStrings(info.Bundles)
-	sort.Strings(info.Bundles)
+	// Sort and remove duplicates
+	info.Bundles = sortedUniqueStrings(info.Bundles)
 	
 	// Count total files
 	info.TotalFiles = len(info.Files)
@@ -279,44 +281,45 @@ func contains(slice []string, item string) bool {
 	return false
 }
 
-// Helper function to get unique strings
-func uniqueStrings(slice []string) []string {
-	seen := make(map[string]bool)
-	result := make([]string, 0)
-	
-	for _, s := range slice {
-		if !seen[s] {
-			seen[s] = true
+// sortedUniqueStrings sorts the slice in place and drops adjacent duplicates,
+// so no map is needed to track the strings already seen
+func sortedUniqueStrings(slice []string) []string {
+	sort.Strings(slice)
+
+	result := slice[:0]
+	for i, s := range slice {
+		if i == 0 || s != slice[i-1] {
 			result = append(result, s)
 		}
 	}
-	
+
 	return result
 }
 
-// isTextFileWithExtensions checks if a file is a text file considering additional extensions
-func isTextFileWithExtensions(path string, additionalExtensions []string) bool {
-	ext := strings.ToLower(filepath.Ext(path))
-	
-	// Check default extensions
-	for _, validExt := range DefaultTextExtensions {
-		if ext == validExt {
-			return true
-		}
+// textExtensionSet holds the lowercase extensions, with leading dot, that
+// identify text files. Callers build it once and then classify each path
+// with a single map lookup.
+type textExtensionSet map[string]bool
+
+// newTextExtensionSet builds the set of default plus additional extensions
+func newTextExtensionSet(additionalExtensions []string) textExtensionSet {
+	set := make(textExtensionSet, len(DefaultTextExtensions)+len(additionalExtensions))
+	for _, ext := range DefaultTextExtensions {
+		set[ext] = true
 	}
-	
-	// Then check additional extensions
-	for _, addExt := range additionalExtensions {
+	for _, ext := range additionalExtensions {
 		// Normalize extension (add leading dot if missing)
-		if !strings.HasPrefix(addExt, ".") {
-			addExt = "." + addExt
-		}
-		if ext == strings.ToLower(addExt) {
-			return true
+		if !strings.HasPrefix(ext, ".") {
+			ext = "." + ext
 		}
+		set[strings.ToLower(ext)] = true
 	}
-	
-	return false
+	return set
+}
+
+// contains reports whether path has one of the extensions in the set
+func (s textExtensionSet) contains(path string) bool {
+	return s[strings.ToLower(filepath.Ext(path))]
 }
 
 // formatFileSize formats a file size in bytes to a human-readable string
@@ -333,42 +336,31 @@ func formatFileSize(size int64) string {
 	return fmt.Sprintf("%.1f %cB", float64(size)/float64(div), "KMGTPE"[exp])
 }
 
+// lineCounts caches whole-file line counts by path, so a file that is listed
+// more than once, for example with different ranges, is only read once
+type lineCounts map[string]int
+
 // countFileLines counts the number of lines in a file, respecting line ranges
-func countFileLines(pathWithRange string) (int, error) {
+func (c lineCounts) countFileLines(pathWithRange string) (int, error) {
 	path, rangeSpec := parsePathWithRange(pathWithRange)
-	
-	file, err := os.Open(path)
-	if err != nil {
-		return 0, err
+
+	lineCount, ok := c[path]
+	if !ok {
+		var err error
+		lineCount, err = countPathLines(path)
+		if err != nil {
+			return 0, err
+		}
+		c[path] = lineCount
 	}
-	defer func() {
-		_ = file.Close()
-	}()
-	
+
 	// If no range specified, count all lines
 	if rangeSpec == "" {
-		scanner := bufio.NewScanner(file)
-		lineCount := 0
-		for scanner.Scan() {
-			lineCount++
-		}
-		if err := scanner.Err(); err != nil {
-			return 0, err
-		}
 		return lineCount, nil
 	}
 	
 	// Parse range specification
-	var lines []string
-	scanner := bufio.NewScanner(file)
-	for scanner.Scan() {
-		lines = append(lines, scanner.Text())
-	}
-	if err := scanner.Err(); err != nil {
-		return 0, err
-	}
-	
-	ranges, err := parseRanges(rangeSpec, len(lines))
+	ranges, err := parseRanges(rangeSpec, lineCount)
 	if err != nil {
 		return 0, err
 	}
@@ -380,4 +372,44 @@ func countFileLines(pathWithRange string) (int, error) {
 	}
 	
 	return totalLines, nil
-}
\ No newline at end of file
+}
+
+// countPathLines counts all lines of the file at path
+func countPathLines(path string) (int, error) {
+	file, err := os.Open(path)
+	if err != nil {
+		return 0, err
+	}
+	defer func() {
+		_ = file.Close()
+	}()
+
+	return countLines(file)
+}
+
+// countLines counts lines the way bufio.ScanLines splits them, streaming the
+// input in fixed-size chunks so only the count, never the lines, is kept
+func countLines(r io.Reader) (int, error) {
+	buf := make([]byte, 32*1024)
+	count := 0
+	last := byte('\n')
+	for {
+		n, err := r.Read(buf)
+		if n > 0 {
+			count += bytes.Count(buf[:n], []byte{'\n'})
+			last = buf[n-1]
+		}
+		if err == io.EOF {
+			break
+		}
+		if err != nil {
+			return 0, err
+		}
+	}
+
+	// A final line without a trailing newline still counts
+	if last != '\n' {
+		count++
+	}
+	return count, nil
+}
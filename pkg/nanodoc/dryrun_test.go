@@ -10,42 +10,23 @@ import (
 
 func TestGenerateDryRunInfo(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-dryrun-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		_ = os.RemoveAll(tempDir)
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files
 	file1 := filepath.Join(tempDir, "test1.txt")
 	file2 := filepath.Join(tempDir, "test2.md")
 	file3 := filepath.Join(tempDir, "test3.go")
 	bundle := filepath.Join(tempDir, "test.bundle.txt")
-	
-	if err := os.WriteFile(file1, []byte("content1"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(file2, []byte("content2"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(file3, []byte("content3"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(bundle, []byte(file1 + "\n" + file2), 0644); err != nil {
-		t.Fatal(err)
-	}
+	txtGlob := filepath.Join(tempDir, "*.txt")
 
-	// Create subdirectory with files
-	subDir := filepath.Join(tempDir, "subdir")
-	if err := os.Mkdir(subDir, 0755); err != nil {
-		t.Fatal(err)
-	}
-	subFile := filepath.Join(subDir, "sub.txt")
-	if err := os.WriteFile(subFile, []byte("sub content"), 0644); err != nil {
-		t.Fatal(err)
-	}
+	writeTestFiles(t, tempDir, map[string]string{
+		"test1.txt":       "content1",
+		"test2.md":        "content2",
+		"test3.go":        "content3",
+		"test.bundle.txt": file1 + "\n" + file2,
+		// Subdirectory with files
+		"subdir/sub.txt": "sub content",
+	})
 
 	tests := []struct {
 		name                 string
@@ -87,8 +68,8 @@ func TestGenerateDryRunInfo(t *testing.T) {
 			name: "glob pattern",
 			pathInfos: []PathInfo{
 				{
-					Original: filepath.Join(tempDir, "*.txt"),
-					Absolute: filepath.Join(tempDir, "*.txt"),
+					Original: txtGlob,
+					Absolute: txtGlob,
 					Type:     "glob",
 					Files:    []string{file1},
 				},
@@ -196,11 +177,7 @@ func TestFormatDryRunOutput(t *testing.T) {
 		"--linenum global",
 	}
 
-	for _, expected := range expectedStrings {
-		if !strings.Contains(output, expected) {
-			t.Errorf("Output missing expected string: %q\nGot:\n%s", expected, output)
-		}
-	}
+	assertOutput(t, output, expectedStrings, nil)
 }
 
 func TestDryRunWithCircularBundle(t *testing.T) {
@@ -209,13 +186,7 @@ func TestDryRunWithCircularBundle(t *testing.T) {
 	// which breaks the cycle. We'll test a valid scenario instead.
 	
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-dryrun-bundle-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		_ = os.RemoveAll(tempDir)
-	}()
+	tempDir := t.TempDir()
 
 	// Create a bundle that references a non-existent file
 	bundle1 := filepath.Join(tempDir, "test.bundle.txt")
@@ -252,20 +223,11 @@ func TestDryRunWithCircularBundle(t *testing.T) {
 
 func TestDryRunWithLineRanges(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-dryrun-ranges-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		_ = os.RemoveAll(tempDir)
-	}()
+	tempDir := t.TempDir()
 
 	// Create a file with 10 lines
 	file1 := filepath.Join(tempDir, "test.txt")
-	content := ""
-	for i := 1; i <= 10; i++ {
-		content += fmt.Sprintf("Line %d\n", i)
-	}
+	content := "Line 1\nLine 2\nLine 3\nLine 4\nLine 5\nLine 6\nLine 7\nLine 8\nLine 9\nLine 10\n"
 	if err := os.WriteFile(file1, []byte(content), 0644); err != nil {
 		t.Fatal(err)
 	}
@@ -308,6 +270,27 @@ func TestDryRunWithLineRanges(t *testing.T) {
 			},
 			wantTotalLines: 3, // Lines 8, 9, 10
 		},
+		{
+			name: "same file with different ranges",
+			pathInfos: []PathInfo{
+				{
+					Original: file1 + ":L2-4",
+					Absolute: file1,
+					Type:     "file",
+				},
+				{
+					Original: file1,
+					Absolute: file1,
+					Type:     "file",
+				},
+				{
+					Original: file1 + ":L9-",
+					Absolute: file1,
+					Type:     "file",
+				},
+			},
+			wantTotalLines: 15, // 3 + 10 + 2
+		},
 	}
 
 	for _, tt := range tests {
@@ -339,25 +322,17 @@ func TestDryRunHelperFunctions(t *testing.T) {
 		t.Error("contains() should return false for non-existing item")
 	}
 
-	// Test uniqueStrings
-	input := []string{"a", "b", "a", "c", "b", "d"}
-	result := uniqueStrings(input)
-	
-	// Check that we have 4 unique strings
-	if len(result) != 4 {
-		t.Errorf("uniqueStrings() returned %d items, want 4", len(result))
+	// Test sortedUniqueStrings
+	sorted := sortedUniqueStrings([]string{"c", "a", "b", "a", "c", "c"})
+	if strings.Join(sorted, ",") != "a,b,c" {
+		t.Errorf("sortedUniqueStrings() = %v, want [a b c]", sorted)
 	}
-	
-	// Check that each unique string is present
-	expected := map[string]bool{"a": true, "b": true, "c": true, "d": true}
-	for _, s := range result {
-		if !expected[s] {
-			t.Errorf("Unexpected string in result: %s", s)
-		}
-		delete(expected, s)
+	sorted = sortedUniqueStrings([]string{"a", "b", "a", "c", "b", "d"})
+	if strings.Join(sorted, ",") != "a,b,c,d" {
+		t.Errorf("sortedUniqueStrings() = %v, want [a b c d]", sorted)
 	}
-	if len(expected) > 0 {
-		t.Error("Not all expected strings were found in result")
+	if len(sortedUniqueStrings(nil)) != 0 {
+		t.Error("sortedUniqueStrings(nil) should be empty")
 	}
 }
 
@@ -386,7 +361,7 @@ func TestFormatFileSize(t *testing.T) {
 	}
 }
 
-func TestIsTextFileWithExtensions(t *testing.T) {
+func TestTextExtensionSet(t *testing.T) {
 	tests := []struct {
 		name                 string
 		path                 string
@@ -439,11 +414,38 @@ func TestIsTextFileWithExtensions(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := isTextFileWithExtensions(tt.path, tt.additionalExtensions)
+			if got := newTextExtensionSet(tt.additionalExtensions).contains(tt.path); got != tt.want {
+				t.Errorf("newTextExtensionSet(%v).contains(%q) = %v, want %v",
+					tt.additionalExtensions, tt.path, got, tt.want)
+			}
+		})
+	}
+}
+
+func TestCountLines(t *testing.T) {
+	tests := []struct {
+		name  string
+		input string
+		want  int
+	}{
+		{"empty", "", 0},
+		{"single line without newline", "hello", 1},
+		{"single line with newline", "hello\n", 1},
+		{"blank lines", "\n\n", 2},
+		{"crlf", "a\r\nb\r\n", 2},
+		{"no trailing newline", "a\nb\nc", 3},
+		{"line longer than a chunk", strings.Repeat("x", 100*1024) + "\ny", 2},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, err := countLines(strings.NewReader(tt.input))
+			if err != nil {
+				t.Fatalf("countLines() error = %v", err)
+			}
 			if got != tt.want {
-				t.Errorf("isTextFileWithExtensions(%q, %v) = %v, want %v", 
-					tt.path, tt.additionalExtensions, got, tt.want)
+				t.Errorf("countLines() = %d, want %d", got, tt.want)
 			}
 		})
 	}
-}
\ No newline at end of file
+}
@@ -1,7 +1,6 @@
 package nanodoc
 
 import (
-	"bufio"
 	"fmt"
 	"os"
 	"strconv"
@@ -13,39 +12,28 @@ import (
 func ExtractFileContent(pathWithRange string) (*FileContent, error) {
 	path, rangeSpec := parsePathWithRange(pathWithRange)
 
-	file, err := os.Open(path)
+	data, err := os.ReadFile(path)
 	if err != nil {
 		if os.IsNotExist(err) {
 			return nil, &FileError{Path: path, Err: ErrFileNotFound}
 		}
 		return nil, &FileError{Path: path, Err: err}
 	}
-	defer func() {
-		_ = file.Close()
-	}()
-
-	var lines []string
-	scanner := bufio.NewScanner(file)
-	for scanner.Scan() {
-		lines = append(lines, scanner.Text())
-	}
-	if err := scanner.Err(); err != nil {
-		return nil, &FileError{Path: path, Err: err}
-	}
+	lines := newLineIndex(string(data))
 
 	var ranges []Range
 	if rangeSpec != "" {
-		parsedRanges, err := parseRanges(rangeSpec, len(lines))
+		parsedRanges, err := parseRanges(rangeSpec, lines.count())
 		if err != nil {
 			return nil, err
 		}
 		ranges = parsedRanges
 	} else {
 		// Default to the full file range.
-		ranges = []Range{{Start: 1, End: len(lines)}}
+		ranges = []Range{{Start: 1, End: lines.count()}}
 	}
 
-	var contentParts []string
+	contentParts := make([]string, 0, len(ranges))
 	for _, r := range ranges {
 		contentPart := extractLinesInRange(lines, &r)
 		contentParts = append(contentParts, contentPart)
@@ -76,10 +64,11 @@ func parsePathWithRange(pathWithRange string) (path, rangeSpec string) {
 
 // parseRanges parses a comma-separated list of range specifications.
 func parseRanges(spec string, totalLines int) ([]Range, error) {
-	rangeStrings := strings.Split(spec, ",")
-	var ranges []Range
+	ranges := make([]Range, 0, strings.Count(spec, ",")+1)
 
-	for _, rangeStr := range rangeStrings {
+	// Walk the comma-separated list in place rather than splitting it.
+	for rest := spec; ; {
+		rangeStr, tail, more := strings.Cut(rest, ",")
 		if !strings.HasPrefix(rangeStr, "L") {
 			return nil, &RangeError{Input: spec, Err: fmt.Errorf("range specifier must start with 'L'")}
 		}
@@ -88,6 +77,10 @@ func parseRanges(spec string, totalLines int) ([]Range, error) {
 			return nil, err // Propagate error with original spec
 		}
 		ranges = append(ranges, *parsedRange)
+		if !more {
+			break
+		}
+		rest = tail
 	}
 
 	return ranges, nil
@@ -130,18 +123,17 @@ func parseSingleRange(spec string, totalLines int) (*Range, error) {
 		}
 	}
 
-	if strings.Contains(spec, "-") {
-		parts := strings.Split(spec, "-")
-		if len(parts) != 2 {
+	if startStr, endStr, isRange := strings.Cut(spec, "-"); isRange {
+		if strings.Contains(endStr, "-") {
 			return nil, &RangeError{Input: spec, Err: fmt.Errorf("invalid range format")}
 		}
 
-		startNum, startIsNeg, err := parseLine(parts[0])
+		startNum, startIsNeg, err := parseLine(startStr)
 		if err != nil {
 			return nil, &RangeError{Input: spec, Err: fmt.Errorf("invalid start line: %w", err)}
 		}
 
-		endNum, endIsNeg, err := parseLine(parts[1])
+		endNum, endIsNeg, err := parseLine(endStr)
 		if err != nil {
 			return nil, &RangeError{Input: spec, Err: fmt.Errorf("invalid end line: %w", err)}
 		}
@@ -157,7 +149,7 @@ func parseSingleRange(spec string, totalLines int) (*Range, error) {
 		end := endNum
 		if endIsNeg {
 			end = totalLines - endNum + 1
-		} else if endNum == 0 && parts[1] == "" { // Handle open-ended range like L10-
+		} else if endNum == 0 && endStr == "" { // Handle open-ended range like L10-
 			end = totalLines
 		}
 
@@ -197,9 +189,73 @@ func parseSingleRange(spec string, totalLines int) (*Range, error) {
 	}
 }
 
-// extractLinesInRange extracts lines from the slice based on the range
-func extractLinesInRange(lines []string, r *Range) string {
-	if len(lines) == 0 {
+// lineIndex records where each line of a text starts and ends, so that line
+// ranges can be sliced out of the text instead of splitting it into lines.
+// Lines follow bufio.ScanLines: a final newline does not start another line
+// and a carriage return before a newline is not part of the line.
+type lineIndex struct {
+	text   string
+	starts []int
+	ends   []int
+	hasCR  bool
+}
+
+// newLineIndex scans text once for newlines and records each line's bounds.
+func newLineIndex(text string) *lineIndex {
+	n := strings.Count(text, "\n") + 1
+	idx := &lineIndex{
+		text:   text,
+		starts: make([]int, 0, n),
+		ends:   make([]int, 0, n),
+		hasCR:  strings.IndexByte(text, '\r') >= 0,
+	}
+	for pos := 0; pos < len(text); {
+		end, next := len(text), len(text)
+		if i := strings.IndexByte(text[pos:], '\n'); i >= 0 {
+			end = pos + i
+			next = end + 1
+		}
+		lineEnd := end
+		if lineEnd > pos && text[lineEnd-1] == '\r' {
+			lineEnd--
+		}
+		idx.starts = append(idx.starts, pos)
+		idx.ends = append(idx.ends, lineEnd)
+		pos = next
+	}
+	return idx
+}
+
+// count returns the number of lines in the text.
+func (idx *lineIndex) count() int {
+	return len(idx.starts)
+}
+
+// join returns lines [first, last) (0-based) joined with newlines.
+func (idx *lineIndex) join(first, last int) string {
+	if first >= last {
+		return ""
+	}
+	if !idx.hasCR {
+		// Without carriage returns the lines already sit in the text
+		// separated by single newlines.
+		return idx.text[idx.starts[first]:idx.ends[last-1]]
+	}
+
+	var b strings.Builder
+	for i := first; i < last; i++ {
+		if i > first {
+			b.WriteByte('\n')
+		}
+		b.WriteString(idx.text[idx.starts[i]:idx.ends[i]])
+	}
+	return b.String()
+}
+
+// extractLinesInRange extracts the lines covered by the range
+func extractLinesInRange(lines *lineIndex, r *Range) string {
+	total := lines.count()
+	if total == 0 {
 		return ""
 	}
 
@@ -208,45 +264,56 @@ func extractLinesInRange(lines []string, r *Range) string {
 	if start < 0 {
 		start = 0
 	}
-	if start >= len(lines) {
+	if start >= total {
 		return ""
 	}
 
 	end := r.End
-	if end == 0 || end > len(lines) {
-		end = len(lines)
+	if end == 0 || end > total {
+		end = total
 	}
 	if end < start {
 		return ""
 	}
 
-	// Extract lines
-	extractedLines := lines[start:end]
-	return strings.Join(extractedLines, "\n")
+	return lines.join(start, end)
 }
 
-// ResolveAndExtractFiles takes a list of resolved paths and extracts their content
+// ResolveAndExtractFiles takes a list of resolved paths and extracts their content.
+// A path listed more than once (directly, or through several bundles or
+// directories) is read and range-sliced only the first time.
 func ResolveAndExtractFiles(pathInfos []PathInfo, additionalExtensions []string) ([]FileContent, error) {
 	var contents []FileContent
+	extracted := make(map[string]*FileContent)
+
+	extract := func(pathWithRange string) error {
+		content, ok := extracted[pathWithRange]
+		if !ok {
+			var err error
+			content, err = ExtractFileContent(pathWithRange)
+			if err != nil {
+				return err
+			}
+			extracted[pathWithRange] = content
+		}
+		contents = append(contents, *content)
+		return nil
+	}
 
 	for _, info := range pathInfos {
 		switch info.Type {
 		case "file":
 			// Single file - check if it has range specification in original path
-			content, err := ExtractFileContent(info.Original)
-			if err != nil {
+			if err := extract(info.Original); err != nil {
 				return nil, err
 			}
-			contents = append(contents, *content)
 
 		case "directory", "glob":
 			// Multiple files from directory or glob
 			for _, filePath := range info.Files {
-				content, err := ExtractFileContent(filePath)
-				if err != nil {
+				if err := extract(filePath); err != nil {
 					return nil, err
 				}
-				contents = append(contents, *content)
 			}
 
 		case "bundle":
@@ -257,5 +324,3 @@ func ResolveAndExtractFiles(pathInfos []PathInfo, additionalExtensions []string)
 
 	return contents, nil
 }
-
-
@@ -3,6 +3,7 @@ package nanodoc
 import (
 	"os"
 	"path/filepath"
+	"strconv"
 	"strings"
 	"testing"
 )
@@ -139,7 +140,7 @@ func TestExtractLinesInRange(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := extractLinesInRange(tt.lines, tt.r)
+			got := extractLinesInRange(newLineIndex(strings.Join(tt.lines, "\n")), tt.r)
 			if got != tt.want {
 				t.Errorf("extractLinesInRange() = %q, want %q", got, tt.want)
 			}
@@ -147,17 +148,42 @@ func TestExtractLinesInRange(t *testing.T) {
 	}
 }
 
+func TestNewLineIndex(t *testing.T) {
+	tests := []struct {
+		name string
+		text string
+		want []string
+	}{
+		{"empty", "", nil},
+		{"no trailing newline", "a\nb", []string{"a", "b"}},
+		{"trailing newline", "a\nb\n", []string{"a", "b"}},
+		{"blank lines", "a\n\n\nb", []string{"a", "", "", "b"}},
+		{"only newline", "\n", []string{""}},
+		{"crlf", "a\r\nb\r\n", []string{"a", "b"}},
+		{"lone cr kept", "a\rb\nc", []string{"a\rb", "c"}},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			idx := newLineIndex(tt.text)
+			if idx.count() != len(tt.want) {
+				t.Fatalf("count() = %d, want %d", idx.count(), len(tt.want))
+			}
+			for first := 0; first <= len(tt.want); first++ {
+				for last := first; last <= len(tt.want); last++ {
+					want := strings.Join(tt.want[first:last], "\n")
+					if got := idx.join(first, last); got != want {
+						t.Errorf("join(%d, %d) = %q, want %q", first, last, got, want)
+					}
+				}
+			}
+		})
+	}
+}
+
 func TestExtractFileContent(t *testing.T) {
 	// Create temp directory and test file
-	tempDir, err := os.MkdirTemp("", "nanodoc-extract-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create test file with known content
 	testFile := filepath.Join(tempDir, "test.txt")
@@ -272,15 +298,7 @@ func TestExtractFileContent(t *testing.T) {
 
 func TestResolveAndExtractFiles(t *testing.T) {
 	// Create temp directory and test files
-	tempDir, err := os.MkdirTemp("", "nanodoc-resolve-extract-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files
 	file1 := filepath.Join(tempDir, "file1.txt")
@@ -332,6 +350,23 @@ func TestResolveAndExtractFiles(t *testing.T) {
 			},
 			wantCount: 2,
 		},
+		{
+			name: "file repeated across entries",
+			pathInfos: []PathInfo{
+				{
+					Original: file1,
+					Absolute: file1,
+					Type:     "file",
+				},
+				{
+					Original: tempDir,
+					Absolute: tempDir,
+					Type:     "directory",
+					Files:    []string{file1, file2},
+				},
+			},
+			wantCount: 3,
+		},
 		{
 			name: "bundle file (not supported yet)",
 			pathInfos: []PathInfo{
@@ -358,4 +393,121 @@ func TestResolveAndExtractFiles(t *testing.T) {
 	}
 }
 
+// setupTestFile creates a temporary file with the given content.
+func setupTestFile(t *testing.T, name string, lines int) string {
+	t.Helper()
+	filePath := filepath.Join(t.TempDir(), name)
+	var content []string
+	for i := 1; i <= lines; i++ {
+		content = append(content, "line "+strconv.Itoa(i))
+	}
+
+	if err := os.WriteFile(filePath, []byte(strings.Join(content, "\n")), 0644); err != nil {
+		t.Fatalf("Failed to write test file: %v", err)
+	}
+
+	return filePath
+}
+
+func TestParseRanges(t *testing.T) {
+	tests := []struct {
+		name       string
+		spec       string
+		totalLines int
+		want       []Range
+		wantErr    bool
+	}{
+		{"single line", "L5", 10, []Range{{5, 5}}, false},
+		{"single range", "L2-4", 10, []Range{{2, 4}}, false},
+		{"multiple ranges", "L2-3,L5-6", 10, []Range{{2, 3}, {5, 6}}, false},
+		{"mixed single and range", "L1,L3-4,L6", 10, []Range{{1, 1}, {3, 4}, {6, 6}}, false},
+		{"unordered declaration", "L10,L1-2", 10, []Range{{10, 10}, {1, 2}}, false},
+		{"overlapping ranges", "L1-5,L3-7", 10, []Range{{1, 5}, {3, 7}}, false},
+		{"negative indices", "L$3-$1,L1", 10, []Range{{8, 10}, {1, 1}}, false},
+		{"open-ended range", "L8-", 10, []Range{{8, 10}}, false},
+		{"invalid spec", "L1,L-", 10, nil, true},
+		{"no L prefix", "1-2", 10, nil, true},
+		{"non-numeric line", "Labc", 10, nil, true},
+		{"non-numeric start", "Labc-10", 10, nil, true},
+		{"non-numeric end", "L10-abc", 10, nil, true},
+		{"zero start", "L0-10", 10, nil, true},
+		{"end before start", "L10-5", 10, nil, true},
+		{"too many dashes", "L1-2-3", 10, nil, true},
+		{"empty entry", "L1,", 10, nil, true},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, err := parseRanges(tt.spec, tt.totalLines)
+			if (err != nil) != tt.wantErr {
+				t.Errorf("parseRanges() error = %v, wantErr %v", err, tt.wantErr)
+				return
+			}
+			if !tt.wantErr && !equalRanges(got, tt.want) {
+				t.Errorf("parseRanges() = %v, want %v", got, tt.want)
+			}
+		})
+	}
+}
+
+func TestExtractFileContent_MultiRange(t *testing.T) {
+	filePath := setupTestFile(t, "test.txt", 10)
 
+	tests := []struct {
+		name        string
+		pathWithRange string
+		wantContent string
+		wantErr     bool
+	}{
+		{
+			"multiple ranges",
+			filePath + ":L1,L3-4,L6",
+			"line 1\nline 3\nline 4\nline 6",
+			false,
+		},
+		{
+			"unordered declaration",
+			filePath + ":L5,L1-2",
+			"line 5\nline 1\nline 2",
+			false,
+		},
+		{
+			"overlapping ranges",
+			filePath + ":L1-3,L2-4",
+			"line 1\nline 2\nline 3\nline 2\nline 3\nline 4",
+			false,
+		},
+		{
+			"full file if no range",
+			filePath,
+			"line 1\nline 2\nline 3\nline 4\nline 5\nline 6\nline 7\nline 8\nline 9\nline 10",
+			false,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			fc, err := ExtractFileContent(tt.pathWithRange)
+			if (err != nil) != tt.wantErr {
+				t.Errorf("ExtractFileContent() error = %v, wantErr %v", err, tt.wantErr)
+				return
+			}
+			if !tt.wantErr && fc.Content != tt.wantContent {
+				t.Errorf("ExtractFileContent() content = %q, want %q", fc.Content, tt.wantContent)
+			}
+		})
+	}
+}
+
+// equalRanges is a helper to compare two slices of Range.
+func equalRanges(a, b []Range) bool {
+	if len(a) != len(b) {
+		return false
+	}
+	for i := range a {
+		if a[i] != b[i] {
+			return false
+		}
+	}
+	return true
+}
@@ -4,9 +4,12 @@ import (
 	"embed"
 	"fmt"
 	"log/slog"
+	"maps"
 	"os"
 	"path/filepath"
+	"slices"
 	"strings"
+	"sync"
 
 	"gopkg.in/yaml.v3"
 )
@@ -37,6 +40,19 @@ var themesFS embed.FS
 
 // GetAvailableThemes returns a list of available theme names
 func GetAvailableThemes() ([]string, error) {
+	themes, err := embeddedThemes()
+	if err != nil {
+		return nil, err
+	}
+	// Hand out a copy so callers cannot change the cached listing
+	return slices.Clone(themes), nil
+}
+
+// embeddedThemes lists the embedded themes once; the set is fixed at build time
+var embeddedThemes = sync.OnceValues(listThemes)
+
+// listThemes reads the theme names from the embedded themes directory
+func listThemes() ([]string, error) {
 	entries, err := themesFS.ReadDir("themes")
 	if err != nil {
 		return nil, fmt.Errorf("failed to read themes directory: %w", err)
@@ -108,8 +124,23 @@ func LoadCustomTheme(themePath string) (*Theme, error) {
 	return theme, nil
 }
 
+// parsedThemes caches the styles of embedded themes by name. The embedded
+// files never change, so each one only needs to be parsed once.
+var (
+	parsedThemesMu sync.Mutex
+	parsedThemes   = make(map[string]map[string]string)
+)
+
 // loadThemeFile loads a theme from the embedded filesystem
 func loadThemeFile(themeName string) (map[string]string, error) {
+	parsedThemesMu.Lock()
+	defer parsedThemesMu.Unlock()
+
+	if styles, ok := parsedThemes[themeName]; ok {
+		// Theme.Styles is exported, so never share the cached map
+		return maps.Clone(styles), nil
+	}
+
 	themePath := fmt.Sprintf("themes/%s.yaml", themeName)
 	
 	data, err := themesFS.ReadFile(themePath)
@@ -122,7 +153,8 @@ func loadThemeFile(themeName string) (map[string]string, error) {
 		return nil, fmt.Errorf("failed to parse theme YAML: %w", err)
 	}
 
-	return styles, nil
+	parsedThemes[themeName] = styles
+	return maps.Clone(styles), nil
 }
 
 // NewFormattingContext creates a new formatting context with the given options
@@ -3,6 +3,7 @@ package nanodoc
 import (
 	"os"
 	"path/filepath"
+	"slices"
 	"testing"
 )
 
@@ -15,14 +16,7 @@ func TestGetAvailableThemes(t *testing.T) {
 	// Check that we have at least the default themes
 	expectedThemes := []string{"classic", "classic-dark", "classic-light"}
 	for _, expected := range expectedThemes {
-		found := false
-		for _, theme := range themes {
-			if theme == expected {
-				found = true
-				break
-			}
-		}
-		if !found {
+		if !slices.Contains(themes, expected) {
 			t.Errorf("Expected theme %q not found in available themes", expected)
 		}
 	}
@@ -33,6 +27,23 @@ func TestGetAvailableThemes(t *testing.T) {
 	}
 }
 
+func TestGetAvailableThemesReturnsCopy(t *testing.T) {
+	themes, err := GetAvailableThemes()
+	if err != nil {
+		t.Fatalf("Failed to get available themes: %v", err)
+	}
+	first := themes[0]
+	themes[0] = "changed"
+
+	again, err := GetAvailableThemes()
+	if err != nil {
+		t.Fatalf("Failed to get available themes: %v", err)
+	}
+	if again[0] != first {
+		t.Errorf("Cached theme list was modified through a returned slice: got %q, want %q", again[0], first)
+	}
+}
+
 func TestLoadTheme(t *testing.T) {
 	tests := []struct {
 		name      string
@@ -99,6 +110,22 @@ func TestLoadTheme(t *testing.T) {
 	}
 }
 
+func TestLoadThemeReturnsCopy(t *testing.T) {
+	theme, err := LoadTheme("classic")
+	if err != nil {
+		t.Fatalf("LoadTheme() error = %v", err)
+	}
+	theme.Styles["injected"] = "value"
+
+	again, err := LoadTheme("classic")
+	if err != nil {
+		t.Fatalf("LoadTheme() error = %v", err)
+	}
+	if _, ok := again.Styles["injected"]; ok {
+		t.Error("Cached theme styles were modified through a loaded theme")
+	}
+}
+
 func TestLoadCustomTheme(t *testing.T) {
 	// Create a temporary theme file
 	tmpDir := t.TempDir()
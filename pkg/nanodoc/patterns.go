@@ -12,6 +12,7 @@ type PatternMatcher struct {
 	includePatterns []string
 	excludePatterns []string
 	baseDir         string
+	basePrefix      string
 	needsRecursion  bool
 }
 
@@ -22,6 +23,13 @@ func NewPatternMatcher(baseDir string, includePatterns, excludePatterns []string
 		excludePatterns: excludePatterns,
 		baseDir:         baseDir,
 	}
+
+	// Precompute "<baseDir>/" so files beneath it can be made relative
+	// with a prefix strip instead of filepath.Rel
+	pm.basePrefix = filepath.Clean(baseDir)
+	if !strings.HasSuffix(pm.basePrefix, string(filepath.Separator)) {
+		pm.basePrefix += string(filepath.Separator)
+	}
 	
 	// Check if any pattern requires recursion
 	pm.needsRecursion = pm.hasRecursivePattern()
@@ -52,11 +60,7 @@ func (pm *PatternMatcher) NeedsRecursion() bool {
 // ShouldInclude determines if a file should be included based on patterns
 func (pm *PatternMatcher) ShouldInclude(filePath string) (bool, error) {
 	// Get relative path from base directory
-	relPath, err := filepath.Rel(pm.baseDir, filePath)
-	if err != nil {
-		// If we can't get relative path, use the full path
-		relPath = filePath
-	}
+	relPath := pm.relativePath(filePath)
 	
 	// Normalize path separators for pattern matching
 	relPath = filepath.ToSlash(relPath)
@@ -96,6 +100,22 @@ func (pm *PatternMatcher) ShouldInclude(filePath string) (bool, error) {
 	return true, nil
 }
 
+// relativePath returns filePath relative to the base directory. Files found
+// while walking the base directory are clean paths beneath it, so the common
+// case is a plain prefix strip; anything else goes through filepath.Rel.
+func (pm *PatternMatcher) relativePath(filePath string) string {
+	if strings.HasPrefix(filePath, pm.basePrefix) && filepath.Clean(filePath) == filePath {
+		return filePath[len(pm.basePrefix):]
+	}
+
+	relPath, err := filepath.Rel(pm.baseDir, filePath)
+	if err != nil {
+		// If we can't get relative path, use the full path
+		return filePath
+	}
+	return relPath
+}
+
 // HasPatterns returns true if any include or exclude patterns are specified
 func (pm *PatternMatcher) HasPatterns() bool {
 	return len(pm.includePatterns) > 0 || len(pm.excludePatterns) > 0
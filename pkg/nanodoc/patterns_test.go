@@ -1,7 +1,6 @@
 package nanodoc
 
 import (
-	"os"
 	"path/filepath"
 	"testing"
 )
@@ -23,16 +22,11 @@ func TestPatternMatcher(t *testing.T) {
 		"node_modules/pkg/doc.md": "# Package Doc",
 	}
 	
-	for path, content := range testFiles {
-		fullPath := filepath.Join(tmpDir, path)
-		dir := filepath.Dir(fullPath)
-		if err := os.MkdirAll(dir, 0755); err != nil {
-			t.Fatal(err)
-		}
-		if err := os.WriteFile(fullPath, []byte(content), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
+	writeTestFiles(t, tmpDir, testFiles)
+
+	// Paths shared by several cases below
+	usersMD := filepath.Join(tmpDir, "api/users.md")
+	readmeMD := filepath.Join(tmpDir, "docs/README.md")
 	
 	tests := []struct {
 		name            string
@@ -46,14 +40,14 @@ func TestPatternMatcher(t *testing.T) {
 		{
 			name:        "no patterns - include all",
 			baseDir:     tmpDir,
-			file:        filepath.Join(tmpDir, "api/users.md"),
+			file:        usersMD,
 			wantInclude: true,
 		},
 		{
 			name:            "include pattern with **",
 			baseDir:         tmpDir,
 			includePatterns: []string{"**/api/*.md"},
-			file:            filepath.Join(tmpDir, "api/users.md"),
+			file:            usersMD,
 			wantInclude:     true,
 			wantRecursion:   true,
 		},
@@ -61,7 +55,7 @@ func TestPatternMatcher(t *testing.T) {
 			name:            "include pattern without match",
 			baseDir:         tmpDir,
 			includePatterns: []string{"**/api/*.md"},
-			file:            filepath.Join(tmpDir, "docs/README.md"),
+			file:            readmeMD,
 			wantInclude:     false,
 			wantRecursion:   true,
 		},
@@ -69,7 +63,7 @@ func TestPatternMatcher(t *testing.T) {
 			name:            "exclude pattern",
 			baseDir:         tmpDir,
 			excludePatterns: []string{"**/README.md"},
-			file:            filepath.Join(tmpDir, "docs/README.md"),
+			file:            readmeMD,
 			wantInclude:     false,
 			wantRecursion:   true,
 		},
@@ -94,7 +88,7 @@ func TestPatternMatcher(t *testing.T) {
 			name:            "simple pattern without **",
 			baseDir:         tmpDir,
 			includePatterns: []string{"api/*.md"},
-			file:            filepath.Join(tmpDir, "api/users.md"),
+			file:            usersMD,
 			wantInclude:     true,
 			wantRecursion:   false,
 		},
@@ -164,4 +158,39 @@ func TestPatternMatcherHasPatterns(t *testing.T) {
 			}
 		})
 	}
-}
\ No newline at end of file
+}
+
+func TestPatternMatcherRelativePath(t *testing.T) {
+	base := filepath.Join(string(filepath.Separator), "base", "dir")
+	matcher := NewPatternMatcher(base, nil, nil)
+
+	tests := []struct {
+		name string
+		file string
+		want string
+	}{
+		{
+			name: "file beneath base",
+			file: filepath.Join(base, "api", "users.md"),
+			want: filepath.Join("api", "users.md"),
+		},
+		{
+			name: "unclean path falls back to Rel",
+			file: base + string(filepath.Separator) + "." + string(filepath.Separator) + "users.md",
+			want: "users.md",
+		},
+		{
+			name: "sibling with shared prefix",
+			file: base + "2" + string(filepath.Separator) + "users.md",
+			want: filepath.Join("..", "dir2", "users.md"),
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			if got := matcher.relativePath(tt.file); got != tt.want {
+				t.Errorf("relativePath(%q) = %q, want %q", tt.file, got, tt.want)
+			}
+		})
+	}
+}
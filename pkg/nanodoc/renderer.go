@@ -18,6 +18,9 @@ type RendererOptions struct {
 	UseRichFormatting  bool
 }
 
+// tocHeader is the fixed title block that opens a rendered table of contents
+const tocHeader = "Table of Contents\n=================\n\n"
+
 // RenderDocument renders a Document object to a string
 func RenderDocument(doc *Document, ctx *FormattingContext) (string, error) {
 	// For markdown output, use enhanced renderer with all features
@@ -30,7 +33,9 @@ func RenderDocument(doc *Document, ctx *FormattingContext) (string, error) {
 		return renderPlainText(doc)
 	}
 
-	var parts []string
+	// Each item contributes at most a separator, its filename banner with
+	// spacing, its content and a closing newline; the TOC adds two parts
+	parts := make([]string, 0, 5*len(doc.ContentItems)+2)
 
 	// Generate TOC first, as it's used for filenames
 	if ctx.ShowTOC || ctx.HeaderFormat == HeaderFormatNice {
@@ -40,26 +45,32 @@ func RenderDocument(doc *Document, ctx *FormattingContext) (string, error) {
 
 	// Render TOC if requested
 	if ctx.ShowTOC {
-		var tocParts []string
-		tocParts = append(tocParts, "Table of Contents")
-		tocParts = append(tocParts, "=================")
-		tocParts = append(tocParts, "")
+		var toc strings.Builder
+		toc.WriteString(tocHeader)
 		for _, entry := range doc.TOC {
 			// Indent based on heading level, assuming Level 1 is the base
-			indent := strings.Repeat("  ", entry.Level-1)
-			tocParts = append(tocParts, fmt.Sprintf("%s- %s (%s)", indent, entry.Title, filepath.Base(entry.Path)))
+			toc.WriteString(strings.Repeat("  ", entry.Level-1))
+			toc.WriteString("- ")
+			toc.WriteString(entry.Title)
+			toc.WriteString(" (")
+			toc.WriteString(filepath.Base(entry.Path))
+			toc.WriteString(")\n")
 		}
-		tocParts = append(tocParts, "")
-		parts = append(parts, strings.Join(tocParts, "\n"))
+		parts = append(parts, toc.String())
 		parts = append(parts, "\n")
 	}
 
+	// Resolve the banner style once rather than per file header
+	banner := resolveBannerStyle(doc.FormattingOptions.HeaderStyle)
+
 	// Render each content item
 	prevOriginalSource := ""
 	sequenceNumber := 0
 	globalLineNumber := 1
 
-	for _, item := range doc.ContentItems {
+	for i := range doc.ContentItems {
+		item := &doc.ContentItems[i]
+
 		// Check if we need a file separator
 		isNotInlined := item.OriginalSource == ""
 		differentSource := item.Filepath != prevOriginalSource
@@ -72,7 +83,7 @@ func RenderDocument(doc *Document, ctx *FormattingContext) (string, error) {
 
 			// Generate filename
 			sequenceNumber++
-			filename := generateFilename(item.Filepath, &doc.FormattingOptions, sequenceNumber, doc)
+			filename := generateFilename(banner, item.Filepath, &doc.FormattingOptions, sequenceNumber, doc)
 			parts = append(parts, filename)
 			parts = append(parts, "\n\n")
 		}
@@ -112,30 +123,31 @@ func RenderDocument(doc *Document, ctx *FormattingContext) (string, error) {
 	return result, nil
 }
 
-func generateFilename(filePath string, opts *FormattingOptions, seqNum int, doc *Document) string {
+func generateFilename(style BannerStyle, filePath string, opts *FormattingOptions, seqNum int, doc *Document) string {
 	headerText := generateFileHeaderText(filePath, opts, seqNum, doc)
 
-	// Get banner style from registry
-	style, exists := GetBannerStyle(opts.HeaderStyle)
+	// Apply the banner style
+	return style.Apply(headerText, opts)
+}
+
+// resolveBannerStyle looks up a banner style in the registry
+func resolveBannerStyle(name string) BannerStyle {
+	style, exists := GetBannerStyle(name)
 	if !exists {
 		// Fallback to none style if not found
 		style, _ = GetBannerStyle("none")
 	}
-
-	// Apply the banner style
-	return style.Apply(headerText, opts)
+	return style
 }
 
+// titleSeparatorReplacer turns the word separators of a filename into spaces
+// in a single pass
+var titleSeparatorReplacer = strings.NewReplacer("_", " ", "-", " ")
+
 // generateFileHeaderText generates the text content for a file header
 func generateFileHeaderText(filePath string, opts *FormattingOptions, seqNum int, doc *Document) string {
 	// Find the primary title for this file from the TOC
-	var title string
-	for _, entry := range doc.TOC {
-		if entry.Path == filePath {
-			title = entry.Title
-			break
-		}
-	}
+	title := doc.fileTitle(filePath)
 
 	var baseName string
 	switch opts.HeaderFormat {
@@ -151,8 +163,7 @@ func generateFileHeaderText(filePath string, opts *FormattingOptions, seqNum int
 		if niceName == "" {
 			filename := filepath.Base(filePath)
 			nameWithoutExt := strings.TrimSuffix(filename, filepath.Ext(filename))
-			niceName = strings.ReplaceAll(nameWithoutExt, "_", " ")
-			niceName = strings.ReplaceAll(niceName, "-", " ")
+			niceName = titleSeparatorReplacer.Replace(nameWithoutExt)
 			niceName = splitCamelCase(niceName)
 			niceName = toTitleCase(niceName)
 		}
@@ -167,6 +178,23 @@ func generateFileHeaderText(filePath string, opts *FormattingOptions, seqNum int
 	return baseName
 }
 
+// fileTitle returns the first TOC title recorded for filePath, or "" if the
+// file has no headings. The lookup table is built once per TOC rather than
+// scanning the whole TOC for every file header, and rebuilt if TOC has since
+// been assigned or appended to with a different length.
+func (d *Document) fileTitle(filePath string) string {
+	if d.tocTitles == nil || d.tocTitlesLen != len(d.TOC) {
+		d.tocTitles = make(map[string]string, len(d.TOC))
+		d.tocTitlesLen = len(d.TOC)
+		for _, entry := range d.TOC {
+			if _, seen := d.tocTitles[entry.Path]; !seen {
+				d.tocTitles[entry.Path] = entry.Title
+			}
+		}
+	}
+	return d.tocTitles[filePath]
+}
+
 // generateSequence generates a sequence number in the specified style
 func generateSequence(num int, style SequenceStyle) string {
 	switch style {
@@ -185,16 +213,22 @@ func generateSequence(num int, style SequenceStyle) string {
 	}
 }
 
+// Patterns used by splitCamelCase, compiled once for all file headers
+var (
+	// A capital letter preceded by a lowercase one (wordNice)
+	camelLowerUpper = regexp.MustCompile("([a-z])([A-Z])")
+	// Consecutive uppercase followed by lowercase (HTMLFile)
+	camelAcronym = regexp.MustCompile("([A-Z])([A-Z][a-z])")
+)
+
 // splitCamelCase splits a camelCase string into words
 func splitCamelCase(s string) string {
 	// Add space before capital letters preceded by lowercase
-	re1 := regexp.MustCompile("([a-z])([A-Z])")
-	s = re1.ReplaceAllString(s, "$1 $2")
-	
+	s = camelLowerUpper.ReplaceAllString(s, "$1 $2")
+
 	// Handle consecutive uppercase followed by lowercase (e.g., HTMLFile -> HTML File)
-	re2 := regexp.MustCompile("([A-Z])([A-Z][a-z])")
-	s = re2.ReplaceAllString(s, "$1 $2")
-	
+	s = camelAcronym.ReplaceAllString(s, "$1 $2")
+
 	return s
 }
 
@@ -214,45 +248,68 @@ func toRoman(num int) string {
 	values := []int{1000, 900, 500, 400, 100, 90, 50, 40, 10, 9, 5, 4, 1}
 	symbols := []string{"M", "CM", "D", "CD", "C", "XC", "L", "XL", "X", "IX", "V", "IV", "I"}
 	
-	result := ""
+	var result strings.Builder
 	for i := 0; i < len(values); i++ {
 		for num >= values[i] {
 			num -= values[i]
-			result += symbols[i]
+			result.WriteString(symbols[i])
 		}
 	}
-	return strings.ToLower(result)
+	return strings.ToLower(result.String())
 }
 
 // addLineNumbers adds line numbers to content
 func addLineNumbers(content string, mode LineNumberMode, startNum int) (string, int) {
-	lines := strings.Split(content, "\n")
-	
+	// Count lines up front instead of materializing them with strings.Split
+	lineCount := strings.Count(content, "\n") + 1
+
 	// Calculate the width needed for line numbers
-	maxLineNum := startNum + len(lines) - 1
+	maxLineNum := startNum + lineCount - 1
 	if mode == LineNumberFile {
-		maxLineNum = len(lines)
+		maxLineNum = lineCount
 	}
 	width := len(strconv.Itoa(maxLineNum))
-	
-	var result []string
+
 	lineNum := startNum
 	if mode == LineNumberFile {
 		lineNum = 1
 	}
-	
-	for _, line := range lines {
+
+	// Write straight into one buffer sized for the content plus the
+	// "<padded number> | " prefix of every line
+	var result strings.Builder
+	result.Grow(len(content) + lineCount*(width+3))
+	numBuf := make([]byte, 0, width)
+
+	// Walk the content line by line, slicing in place
+	rest := content
+	for {
+		line := rest
+		idx := strings.IndexByte(rest, '\n')
+		if idx >= 0 {
+			line = rest[:idx]
+		}
+
 		// Don't add line numbers to empty lines at the end
-		if line == "" && lineNum == len(lines) {
-			result = append(result, line)
-		} else {
-			numberedLine := fmt.Sprintf("%*d | %s", width, lineNum, line)
-			result = append(result, numberedLine)
+		if line != "" || lineNum != lineCount {
+			numBuf = strconv.AppendInt(numBuf[:0], int64(lineNum), 10)
+			for pad := width - len(numBuf); pad > 0; pad-- {
+				result.WriteByte(' ')
+			}
+			result.Write(numBuf)
+			result.WriteString(" | ")
+			result.WriteString(line)
 		}
 		lineNum++
+
+		if idx < 0 {
+			break
+		}
+		result.WriteByte('\n')
+		rest = rest[idx+1:]
 	}
-	
-	return strings.Join(result, "\n"), lineNum
+
+	return result.String(), lineNum
 }
 
 // generateTOC generates a table of contents for the document using the markdown parser.
@@ -270,6 +327,13 @@ func generateTOC(doc *Document) {
 			continue
 		}
 
+		// Every markdown heading needs a '#' (ATX) or a '=' / '-' underline
+		// (setext); without any of them there is nothing to find, so skip the
+		// full parse
+		if !strings.ContainsAny(item.Content, "#=-") {
+			continue
+		}
+
 		mdDoc, err := parser.Parse([]byte(item.Content))
 		if err != nil {
 			slog.Warn("failed to parse markdown for TOC generation", "file", item.Filepath, "error", err)
@@ -289,6 +353,7 @@ func generateTOC(doc *Document) {
 		}
 	}
 	doc.TOC = allHeadings
+	doc.tocTitles = nil
 }
 
 
@@ -296,7 +361,7 @@ func generateTOC(doc *Document) {
 // renderMarkdownBasic performs basic concatenation of markdown files without any modifications
 // This is kept for backward compatibility and fallback
 func renderMarkdownBasic(doc *Document) (string, error) {
-	var parts []string
+	parts := make([]string, 0, 2*len(doc.ContentItems))
 
 	for _, item := range doc.ContentItems {
 		// Simply append the content as-is
@@ -404,7 +469,7 @@ func renderMarkdownEnhanced(doc *Document, ctx *FormattingContext) (string, erro
 
 // renderPlainText performs basic concatenation without any formatting
 func renderPlainText(doc *Document) (string, error) {
-	var parts []string
+	parts := make([]string, 0, 2*len(doc.ContentItems))
 
 	for _, item := range doc.ContentItems {
 		// Simply append the content as-is
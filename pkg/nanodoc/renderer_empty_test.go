@@ -5,207 +5,127 @@ import (
 	"testing"
 )
 
+// newEmptyTestDocument builds a fresh document around items, with the nice
+// numbered headers every test in this file renders with
+func newEmptyTestDocument(items ...FileContent) *Document {
+	return &Document{
+		ContentItems: items,
+		FormattingOptions: FormattingOptions{
+			ShowFilenames: true,
+			HeaderFormat:  HeaderFormatNice,
+			SequenceStyle: SequenceNumerical,
+		},
+	}
+}
+
+// newEmptyTestContext returns the formatting context matching
+// newEmptyTestDocument, with the given line numbering
+func newEmptyTestContext(lineNumbers LineNumberMode) *FormattingContext {
+	return &FormattingContext{
+		ShowFilenames: true,
+		HeaderFormat:  HeaderFormatNice,
+		SequenceStyle: SequenceNumerical,
+		LineNumbers:   lineNumbers,
+	}
+}
+
 func TestRenderEmptyFiles(t *testing.T) {
 	tests := []struct {
 		name        string
-		doc         *Document
-		ctx         *FormattingContext
-		wantContain string
+		items       []FileContent
+		lineNumbers LineNumberMode
+		showTOC     bool
+		want        []string
+		dontWant    []string
+		wantEmpty   int // occurrences of the "(empty file)" placeholder
 	}{
 		{
-			name: "empty file without line numbers",
-			doc: &Document{
-				ContentItems: []FileContent{
-					{
-						Filepath: "empty.txt",
-						Content:  "",
-					},
-				},
-				FormattingOptions: FormattingOptions{
-					ShowFilenames:   true,
-					HeaderFormat:   HeaderFormatNice,
-					SequenceStyle: SequenceNumerical,
-				},
-			},
-			ctx: &FormattingContext{
-				ShowFilenames:   true,
-				HeaderFormat:   HeaderFormatNice,
-				SequenceStyle: SequenceNumerical,
-				LineNumbers:   LineNumberNone,
-			},
-			wantContain: "(empty file)",
+			name:      "empty file without line numbers",
+			items:     []FileContent{{Filepath: "empty.txt", Content: ""}},
+			want:      []string{"(empty file)"},
+			wantEmpty: 1,
 		},
 		{
-			name: "empty file with file line numbers",
-			doc: &Document{
-				ContentItems: []FileContent{
-					{
-						Filepath: "empty.txt",
-						Content:  "",
-					},
-				},
-				FormattingOptions: FormattingOptions{
-					ShowFilenames:   true,
-					HeaderFormat:   HeaderFormatNice,
-					SequenceStyle: SequenceNumerical,
-				},
-			},
-			ctx: &FormattingContext{
-				ShowFilenames:   true,
-				HeaderFormat:   HeaderFormatNice,
-				SequenceStyle: SequenceNumerical,
-				LineNumbers:   LineNumberFile,
-			},
-			wantContain: "1 | (empty file)",
+			name:        "empty file with file line numbers",
+			items:       []FileContent{{Filepath: "empty.txt", Content: ""}},
+			lineNumbers: LineNumberFile,
+			want:        []string{"1 | (empty file)"},
+			wantEmpty:   1,
 		},
 		{
 			name: "empty file with global line numbers",
-			doc: &Document{
-				ContentItems: []FileContent{
-					{
-						Filepath: "first.txt",
-						Content:  "Some content\nLine 2",
-					},
-					{
-						Filepath: "empty.txt",
-						Content:  "",
-					},
-				},
-				FormattingOptions: FormattingOptions{
-					ShowFilenames:   true,
-					HeaderFormat:   HeaderFormatNice,
-					SequenceStyle: SequenceNumerical,
-				},
+			items: []FileContent{
+				{Filepath: "first.txt", Content: "Some content\nLine 2"},
+				{Filepath: "empty.txt", Content: ""},
 			},
-			ctx: &FormattingContext{
-				ShowFilenames:   true,
-				HeaderFormat:   HeaderFormatNice,
-				SequenceStyle: SequenceNumerical,
-				LineNumbers:   LineNumberGlobal,
+			lineNumbers: LineNumberGlobal,
+			want:        []string{"3 | (empty file)"},
+			wantEmpty:   1,
+		},
+		{
+			name: "only empty files",
+			items: []FileContent{
+				{Filepath: "empty1.txt", Content: ""},
+				{Filepath: "empty2.txt", Content: ""},
 			},
-			wantContain: "3 | (empty file)",
+			want:      []string{"1. Empty1", "(empty file)", "2. Empty2"},
+			wantEmpty: 2,
 		},
 		{
-			name: "multiple empty files",
-			doc: &Document{
-				ContentItems: []FileContent{
-					{
-						Filepath: "empty1.txt",
-						Content:  "",
-					},
-					{
-						Filepath: "empty2.txt",
-						Content:  "",
-					},
-				},
-				FormattingOptions: FormattingOptions{
-					ShowFilenames:   true,
-					HeaderFormat:   HeaderFormatNice,
-					SequenceStyle: SequenceNumerical,
-				},
+			name: "empty file between files with content",
+			items: []FileContent{
+				{Filepath: "normal.txt", Content: "This file has content"},
+				{Filepath: "empty.txt", Content: ""},
+				{Filepath: "another.txt", Content: "More content here"},
+			},
+			want: []string{
+				"1. Normal",
+				"This file has content",
+				"2. Empty",
+				"(empty file)",
+				"3. Another",
+				"More content here",
 			},
-			ctx: &FormattingContext{
-				ShowFilenames:   true,
-				HeaderFormat:   HeaderFormatNice,
-				SequenceStyle: SequenceNumerical,
-				LineNumbers:   LineNumberNone,
+			wantEmpty: 1,
+		},
+		{
+			// Empty files must not break TOC generation
+			name: "empty file with TOC",
+			items: []FileContent{
+				{Filepath: "empty.md", Content: ""},
+				{Filepath: "content.md", Content: "# Title\nSome content"},
 			},
-			wantContain: "(empty file)",
+			showTOC:   true,
+			want:      []string{"Table of Contents", "- Title (content.md)"},
+			dontWant:  []string{"empty.md"},
+			wantEmpty: 1,
 		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got, err := RenderDocument(tt.doc, tt.ctx)
+			doc := newEmptyTestDocument(tt.items...)
+			ctx := newEmptyTestContext(tt.lineNumbers)
+			doc.FormattingOptions.ShowTOC = tt.showTOC
+			ctx.ShowTOC = tt.showTOC
+
+			got, err := RenderDocument(doc, ctx)
 			if err != nil {
 				t.Fatalf("RenderDocument() error = %v", err)
 			}
 
-			if !strings.Contains(got, tt.wantContain) {
-				t.Errorf("RenderDocument() output doesn't contain %q\nGot:\n%s", tt.wantContain, got)
-			}
-
-			// Count occurrences for multiple empty files test
-			if tt.name == "multiple empty files" {
-				count := strings.Count(got, "(empty file)")
-				if count != 2 {
-					t.Errorf("Expected 2 occurrences of '(empty file)', got %d", count)
-				}
+			assertOutput(t, got, tt.want, tt.dontWant)
+			if count := strings.Count(got, "(empty file)"); count != tt.wantEmpty {
+				t.Errorf("Expected %d occurrences of '(empty file)', got %d", tt.wantEmpty, count)
 			}
 		})
 	}
 }
 
-func TestEmptyFileIntegration(t *testing.T) {
-	// Test that empty files are handled correctly through the full pipeline
-	doc := &Document{
-		ContentItems: []FileContent{
-			{
-				Filepath: "normal.txt",
-				Content:  "This file has content",
-			},
-			{
-				Filepath: "empty.txt",
-				Content:  "",
-			},
-			{
-				Filepath: "another.txt",
-				Content:  "More content here",
-			},
-		},
-		FormattingOptions: FormattingOptions{
-			ShowFilenames:   true,
-			HeaderFormat:   HeaderFormatNice,
-			SequenceStyle: SequenceNumerical,
-		},
-	}
-
-	ctx := &FormattingContext{
-		ShowFilenames:   true,
-		HeaderFormat:   HeaderFormatNice,
-		SequenceStyle: SequenceNumerical,
-		LineNumbers:   LineNumberNone,
-	}
-
-	got, err := RenderDocument(doc, ctx)
-	if err != nil {
-		t.Fatalf("RenderDocument() error = %v", err)
-	}
-
-	// Check structure
-	expectedParts := []string{
-		"1. Normal",
-		"This file has content",
-		"2. Empty",
-		"(empty file)",
-		"3. Another",
-		"More content here",
-	}
-
-	for _, part := range expectedParts {
-		if !strings.Contains(got, part) {
-			t.Errorf("Output missing expected part: %q\nGot:\n%s", part, got)
-		}
-	}
-}
-
 func TestEmptyDocument(t *testing.T) {
 	// Test rendering a document with no content items
-	doc := &Document{
-		ContentItems: []FileContent{},
-		FormattingOptions: FormattingOptions{
-			ShowFilenames:   true,
-			HeaderFormat:   HeaderFormatNice,
-			SequenceStyle: SequenceNumerical,
-		},
-	}
-
-	ctx := &FormattingContext{
-		ShowFilenames:   true,
-		HeaderFormat:   HeaderFormatNice,
-		SequenceStyle: SequenceNumerical,
-		LineNumbers:   LineNumberNone,
-	}
+	doc := newEmptyTestDocument()
+	ctx := newEmptyTestContext(LineNumberNone)
 
 	got, err := RenderDocument(doc, ctx)
 	if err != nil {
@@ -216,96 +136,3 @@ func TestEmptyDocument(t *testing.T) {
 		t.Errorf("Expected empty string for empty document, got %q", got)
 	}
 }
-
-func TestDocumentWithOnlyEmptyFiles(t *testing.T) {
-	// Test rendering a document with only empty files
-	doc := &Document{
-		ContentItems: []FileContent{
-			{
-				Filepath: "empty1.txt",
-				Content:  "",
-			},
-			{
-				Filepath: "empty2.txt",
-				Content:  "",
-			},
-		},
-		FormattingOptions: FormattingOptions{
-			ShowFilenames:   true,
-			HeaderFormat:   HeaderFormatNice,
-			SequenceStyle: SequenceNumerical,
-		},
-	}
-
-	ctx := &FormattingContext{
-		ShowFilenames:   true,
-		HeaderFormat:   HeaderFormatNice,
-		SequenceStyle: SequenceNumerical,
-		LineNumbers:   LineNumberNone,
-	}
-
-	got, err := RenderDocument(doc, ctx)
-	if err != nil {
-		t.Fatalf("RenderDocument() error = %v", err)
-	}
-
-	// Check structure
-	expectedParts := []string{
-		"1. Empty1",
-		"(empty file)",
-		"2. Empty2",
-		"(empty file)",
-	}
-
-	for _, part := range expectedParts {
-		if !strings.Contains(got, part) {
-			t.Errorf("Output missing expected part: %q\nGot:\n%s", part, got)
-		}
-	}
-}
-
-func TestEmptyFileWithTOC(t *testing.T) {
-	// Test that empty files don't break TOC generation
-	doc := &Document{
-		ContentItems: []FileContent{
-			{
-				Filepath: "empty.md",
-				Content:  "",
-			},
-			{
-				Filepath: "content.md",
-				Content:  "# Title\nSome content",
-			},
-		},
-		FormattingOptions: FormattingOptions{
-			ShowFilenames:   true,
-			HeaderFormat:   HeaderFormatNice,
-			SequenceStyle: SequenceNumerical,
-			ShowTOC:       true,
-		},
-	}
-
-	ctx := &FormattingContext{
-		ShowFilenames:   true,
-		HeaderFormat:   HeaderFormatNice,
-		SequenceStyle: SequenceNumerical,
-		LineNumbers:   LineNumberNone,
-		ShowTOC:       true,
-	}
-
-	got, err := RenderDocument(doc, ctx)
-	if err != nil {
-		t.Fatalf("RenderDocument() error = %v", err)
-	}
-
-	// Check that TOC is generated correctly
-	if !strings.Contains(got, "Table of Contents") {
-		t.Error("Output missing TOC")
-	}
-	if !strings.Contains(got, "- Title (content.md)") {
-		t.Error("Output missing TOC entry for content.md")
-	}
-	if strings.Contains(got, "empty.md") {
-		t.Error("Output should not contain TOC entry for empty.md")
-	}
-}
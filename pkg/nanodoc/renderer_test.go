@@ -5,6 +5,27 @@ import (
 	"testing"
 )
 
+// assertOutput checks that output contains every want substring and none
+// of the dontWant substrings, reporting all mismatches in a single error
+// so the output is printed once rather than once per substring.
+func assertOutput(t *testing.T, output string, want, dontWant []string) {
+	t.Helper()
+	var missing, unexpected []string
+	for _, w := range want {
+		if !strings.Contains(output, w) {
+			missing = append(missing, w)
+		}
+	}
+	for _, d := range dontWant {
+		if strings.Contains(output, d) {
+			unexpected = append(unexpected, d)
+		}
+	}
+	if len(missing) > 0 || len(unexpected) > 0 {
+		t.Errorf("Output is missing %q and contains unwanted %q.\nGot:\n%s", missing, unexpected, output)
+	}
+}
+
 func TestGenerateSequence(t *testing.T) {
 	tests := []struct {
 		name  string
@@ -160,10 +181,46 @@ func TestAddLineNumbers(t *testing.T) {
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
 			got, _ := addLineNumbers(tt.content, tt.mode, tt.startNum)
-			for _, want := range tt.wantHas {
-				if !strings.Contains(got, want) {
-					t.Errorf("addLineNumbers() result doesn't contain %q", want)
-				}
+			assertOutput(t, got, tt.wantHas, nil)
+		})
+	}
+}
+
+func TestAddLineNumbersExactOutput(t *testing.T) {
+	tests := []struct {
+		name     string
+		content  string
+		mode     LineNumberMode
+		startNum int
+		want     string
+		wantNext int
+	}{
+		{
+			name:     "trailing newline left unnumbered",
+			content:  "a\nb\n",
+			mode:     LineNumberFile,
+			startNum: 1,
+			want:     "1 | a\n2 | b\n",
+			wantNext: 4,
+		},
+		{
+			name:     "global mode continues numbering",
+			content:  "x\ny",
+			mode:     LineNumberGlobal,
+			startNum: 9,
+			want:     " 9 | x\n10 | y",
+			wantNext: 11,
+		},
+	}
+
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			got, next := addLineNumbers(tt.content, tt.mode, tt.startNum)
+			if got != tt.want {
+				t.Errorf("addLineNumbers() = %q, want %q", got, tt.want)
+			}
+			if next != tt.wantNext {
+				t.Errorf("addLineNumbers() next = %d, want %d", next, tt.wantNext)
 			}
 		})
 	}
@@ -263,11 +320,24 @@ func TestGenerateFilename(t *testing.T) {
 			doc:    &Document{},
 			want:   "                                      1. Test File",
 		},
+		{
+			name:     "unknown banner style falls back to none",
+			filepath: "/path/to/test_file.txt",
+			opts: &FormattingOptions{
+				HeaderFormat:    HeaderFormatNice,
+				SequenceStyle:   SequenceNumerical,
+				HeaderAlignment: "left",
+				HeaderStyle:     "no-such-style",
+			},
+			seqNum: 1,
+			doc:    &Document{},
+			want:   "1. Test File",
+		},
 	}
 
 	for _, tt := range tests {
 		t.Run(tt.name, func(t *testing.T) {
-			got := generateFilename(tt.filepath, tt.opts, tt.seqNum, tt.doc)
+			got := generateFilename(resolveBannerStyle(tt.opts.HeaderStyle), tt.filepath, tt.opts, tt.seqNum, tt.doc)
 			if got != tt.want {
 				t.Errorf("generateFilename() = %v, want %v", got, tt.want)
 			}
@@ -275,6 +345,37 @@ func TestGenerateFilename(t *testing.T) {
 	}
 }
 
+func TestDocumentFileTitle(t *testing.T) {
+	doc := &Document{
+		TOC: []TOCEntry{
+			{Path: "/a.md", Title: "First", Level: 1},
+			{Path: "/a.md", Title: "Second", Level: 2},
+			{Path: "/b.md", Title: "Other", Level: 1},
+			{Path: "/a.md", Title: "Later", Level: 1},
+		},
+	}
+
+	if got := doc.fileTitle("/a.md"); got != "First" {
+		t.Errorf("fileTitle(/a.md) = %q, want %q", got, "First")
+	}
+	if got := doc.fileTitle("/b.md"); got != "Other" {
+		t.Errorf("fileTitle(/b.md) = %q, want %q", got, "Other")
+	}
+	if got := doc.fileTitle("/missing.txt"); got != "" {
+		t.Errorf("fileTitle(/missing.txt) = %q, want empty", got)
+	}
+
+	// Changing TOC directly must not leave stale titles behind
+	doc.TOC = append(doc.TOC, TOCEntry{Path: "/c.md", Title: "Appended", Level: 1})
+	if got := doc.fileTitle("/c.md"); got != "Appended" {
+		t.Errorf("fileTitle(/c.md) after append = %q, want %q", got, "Appended")
+	}
+	doc.TOC = []TOCEntry{{Path: "/a.md", Title: "Replaced", Level: 1}}
+	if got := doc.fileTitle("/a.md"); got != "Replaced" {
+		t.Errorf("fileTitle(/a.md) after reassign = %q, want %q", got, "Replaced")
+	}
+}
+
 func TestBannerStyles(t *testing.T) {
 	tests := []struct {
 		name            string
@@ -355,11 +456,7 @@ func TestBannerStyles(t *testing.T) {
 				t.Fatalf("RenderDocument() error = %v", err)
 			}
 
-			for _, want := range tt.wantContains {
-				if !strings.Contains(output, want) {
-					t.Errorf("Output does not contain %q\nGot:\n%s", want, output)
-				}
-			}
+			assertOutput(t, output, tt.wantContains, nil)
 		})
 	}
 }
@@ -451,11 +548,7 @@ func TestRenderDocument(t *testing.T) {
 				t.Fatalf("RenderDocument() error = %v", err)
 			}
 
-			for _, want := range tt.want {
-				if !strings.Contains(got, want) {
-					t.Errorf("RenderDocument() output doesn't contain %q", want)
-				}
-			}
+			assertOutput(t, got, tt.want, nil)
 		})
 	}
 }
@@ -501,6 +594,27 @@ func TestGenerateTOC(t *testing.T) {
 	}
 }
 
+func TestGenerateTOCWithoutHeadingMarkers(t *testing.T) {
+	doc := &Document{
+		ContentItems: []FileContent{
+			{Filepath: "/test/plain.md", Content: "Just a paragraph\nwith no headings at all"},
+			{Filepath: "/test/setext.md", Content: "Setext Title\n============\n\nBody"},
+		},
+		FormattingOptions: FormattingOptions{
+			SequenceStyle: SequenceNumerical,
+		},
+	}
+
+	generateTOC(doc)
+
+	if len(doc.TOC) != 1 {
+		t.Fatalf("Expected 1 TOC entry, got %d: %+v", len(doc.TOC), doc.TOC)
+	}
+	if doc.TOC[0].Title != "Setext Title" || doc.TOC[0].Path != "/test/setext.md" {
+		t.Errorf("Unexpected TOC entry: %+v", doc.TOC[0])
+	}
+}
+
 func TestRenderMarkdownBasic(t *testing.T) {
 	tests := []struct {
 		name     string
@@ -794,12 +908,10 @@ func TestRenderMarkdownEnhanced(t *testing.T) {
 				ShowTOC:       false,
 			},
 			checkFunc: func(t *testing.T, result string) {
-				if !strings.Contains(result, "# Hello World") {
-					t.Errorf("Should preserve markdown header, got: %q", result)
-				}
-				if !strings.Contains(result, "This is a test.") {
-					t.Errorf("Should preserve content, got: %q", result)
-				}
+				assertOutput(t, result, []string{
+					"# Hello World",
+					"This is a test.",
+				}, nil)
 			},
 		},
 		{
@@ -824,18 +936,14 @@ func TestRenderMarkdownEnhanced(t *testing.T) {
 				ShowTOC:       false,
 			},
 			checkFunc: func(t *testing.T, result string) {
-				// First doc should keep H1
-				if !strings.Contains(result, "# First Doc") {
-					t.Errorf("First doc should keep H1, got: %q", result)
-				}
-				// Second doc should have H1 adjusted to H2
-				if !strings.Contains(result, "## Second Doc") {
-					t.Errorf("Second doc should have H1 adjusted to H2, got: %q", result)
-				}
-				// Second doc's H2 should become H3
-				if !strings.Contains(result, "### Another Section") {
-					t.Errorf("Second doc's H2 should become H3, got: %q", result)
-				}
+				assertOutput(t, result, []string{
+					// First doc should keep H1
+					"# First Doc",
+					// Second doc should have H1 adjusted to H2
+					"## Second Doc",
+					// Second doc's H2 should become H3
+					"### Another Section",
+				}, nil)
 			},
 		},
 		{
@@ -861,12 +969,10 @@ func TestRenderMarkdownEnhanced(t *testing.T) {
 				ShowFilenames: true,
 			},
 			checkFunc: func(t *testing.T, result string) {
-				if !strings.Contains(result, "## 1. Doc1") {
-					t.Errorf("Should contain numbered file header for doc1, got: %q", result)
-				}
-				if !strings.Contains(result, "## 2. Doc2") {
-					t.Errorf("Should contain numbered file header for doc2, got: %q", result)
-				}
+				assertOutput(t, result, []string{
+					"## 1. Doc1",
+					"## 2. Doc2",
+				}, nil)
 			},
 		},
 		{
@@ -887,18 +993,12 @@ func TestRenderMarkdownEnhanced(t *testing.T) {
 				ShowTOC: true,
 			},
 			checkFunc: func(t *testing.T, result string) {
-				if !strings.Contains(result, "## Table of Contents") {
-					t.Errorf("Should contain TOC header, got: %q", result)
-				}
-				if !strings.Contains(result, "- [guide.md - Main Title]") {
-					t.Errorf("Should contain TOC entry for main title, got: %q", result)
-				}
-				if !strings.Contains(result, "  - [guide.md - Section 1]") {
-					t.Errorf("Should contain nested TOC entry, got: %q", result)
-				}
-				if !strings.Contains(result, "    - [guide.md - Subsection]") {
-					t.Errorf("Should contain nested TOC entry for H3, got: %q", result)
-				}
+				assertOutput(t, result, []string{
+					"## Table of Contents",
+					"- [guide.md - Main Title]",
+					"  - [guide.md - Section 1]",
+					"    - [guide.md - Subsection]",
+				}, nil)
 			},
 		},
 		{
@@ -926,21 +1026,15 @@ func TestRenderMarkdownEnhanced(t *testing.T) {
 				ShowTOC:       true,
 			},
 			checkFunc: func(t *testing.T, result string) {
-				// Check TOC
-				if !strings.Contains(result, "## Table of Contents") {
-					t.Errorf("Should contain TOC, got: %q", result)
-				}
-				// Check file headers (should be "nice" format from TOC)
-				if !strings.Contains(result, "## a. Project") {
-					t.Errorf("Should contain letter sequence file header, got: %q", result)
-				}
-				if !strings.Contains(result, "## b. Guide") {
-					t.Errorf("Should contain second file header, got: %q", result)
-				}
-				// Check header adjustment
-				if !strings.Contains(result, "## Guide") {
-					t.Errorf("Second file H1 should be adjusted to H2, got: %q", result)
-				}
+				assertOutput(t, result, []string{
+					// Check TOC
+					"## Table of Contents",
+					// Check file headers (should be "nice" format from TOC)
+					"## a. Project",
+					"## b. Guide",
+					// Check header adjustment
+					"## Guide",
+				}, nil)
 			},
 		},
 		{
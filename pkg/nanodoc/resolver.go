@@ -1,6 +1,7 @@
 package nanodoc
 
 import (
+	"io/fs"
 	"os"
 	"path/filepath"
 	"sort"
@@ -172,10 +173,17 @@ func resolveGlobPathWithOptions(pattern string, options *FormattingOptions) (Pat
 		return PathInfo{}, ErrFileNotFound
 	}
 
+	var additionalExts []string
+	if options != nil {
+		additionalExts = options.AdditionalExtensions
+	}
+	textExts := newTextExtensionSet(additionalExts)
+
 	// Filter to only include files (not directories)
 	var files []string
+	var resolver absPathResolver
 	for _, match := range matches {
-		absPath, err := filepath.Abs(match)
+		absPath, err := resolver.Abs(match)
 		if err != nil {
 			continue
 		}
@@ -185,14 +193,8 @@ func resolveGlobPathWithOptions(pattern string, options *FormattingOptions) (Pat
 			continue
 		}
 
-		if !info.IsDir() {
-			isText := isTextFile(absPath)
-			if options != nil && len(options.AdditionalExtensions) > 0 {
-				isText = isTextFileWithExtensions(absPath, options.AdditionalExtensions)
-			}
-			if isText {
-				files = append(files, absPath)
-			}
+		if !info.IsDir() && textExts.contains(absPath) {
+			files = append(files, absPath)
 		}
 	}
 
@@ -209,6 +211,34 @@ func resolveGlobPathWithOptions(pattern string, options *FormattingOptions) (Pat
 	}, nil
 }
 
+// absPathResolver makes paths absolute like filepath.Abs, but looks the
+// working directory up only once instead of once per relative path
+type absPathResolver struct {
+	cwd    string
+	err    error
+	loaded bool
+}
+
+// Abs returns an absolute representation of path
+func (r *absPathResolver) Abs(path string) (string, error) {
+	if filepath.IsAbs(path) {
+		return filepath.Clean(path), nil
+	}
+	// On Windows, rooted paths like \foo and drive-relative paths like C:foo
+	// are not absolute but must not be joined onto the working directory
+	if filepath.VolumeName(path) != "" || (path != "" && os.IsPathSeparator(path[0])) {
+		return filepath.Abs(path)
+	}
+	if !r.loaded {
+		r.cwd, r.err = os.Getwd()
+		r.loaded = true
+	}
+	if r.err != nil {
+		return "", r.err
+	}
+	return filepath.Join(r.cwd, path), nil
+}
+
 // isBundleFile checks if a file is a bundle file based on naming convention
 func isBundleFile(path string) bool {
 	base := filepath.Base(path)
@@ -219,6 +249,7 @@ func isBundleFile(path string) bool {
 // findTextFilesInDirWithExtensions finds all text files in a directory with optional additional extensions
 func findTextFilesInDirWithExtensions(dir string, additionalExtensions []string) ([]string, error) {
 	var files []string
+	textExts := newTextExtensionSet(additionalExtensions)
 
 	entries, err := os.ReadDir(dir)
 	if err != nil {
@@ -231,7 +262,7 @@ func findTextFilesInDirWithExtensions(dir string, additionalExtensions []string)
 		}
 
 		fullPath := filepath.Join(dir, entry.Name())
-		if isTextFileWithExtensions(fullPath, additionalExtensions) {
+		if textExts.contains(fullPath) {
 			files = append(files, fullPath)
 		}
 	}
@@ -245,6 +276,7 @@ func findTextFilesInDirWithExtensions(dir string, additionalExtensions []string)
 // findTextFilesWithMatcher finds text files in a directory with pattern matching
 func findTextFilesWithMatcher(dir string, additionalExtensions []string, matcher *PatternMatcher) ([]string, error) {
 	var files []string
+	textExts := newTextExtensionSet(additionalExtensions)
 
 	entries, err := os.ReadDir(dir)
 	if err != nil {
@@ -257,7 +289,7 @@ func findTextFilesWithMatcher(dir string, additionalExtensions []string, matcher
 		}
 
 		fullPath := filepath.Join(dir, entry.Name())
-		if isTextFileWithExtensions(fullPath, additionalExtensions) {
+		if textExts.contains(fullPath) {
 			shouldInclude, err := matcher.ShouldInclude(fullPath)
 			if err != nil {
 				return nil, err
@@ -275,17 +307,20 @@ func findTextFilesWithMatcher(dir string, additionalExtensions []string, matcher
 // findTextFilesRecursive recursively finds text files with pattern matching
 func findTextFilesRecursive(dir string, additionalExtensions []string, matcher *PatternMatcher) ([]string, error) {
 	var files []string
+	textExts := newTextExtensionSet(additionalExtensions)
 
-	err := filepath.Walk(dir, func(path string, info os.FileInfo, err error) error {
+	// WalkDir uses the directory entries' type bits instead of an lstat per
+	// file, which is most of the cost of filepath.Walk on large trees
+	err := filepath.WalkDir(dir, func(path string, d fs.DirEntry, err error) error {
 		if err != nil {
 			return err
 		}
 
-		if info.IsDir() {
+		if d.IsDir() {
 			return nil
 		}
 
-		if isTextFileWithExtensions(path, additionalExtensions) {
+		if textExts.contains(path) {
 			shouldInclude, err := matcher.ShouldInclude(path)
 			if err != nil {
 				return err
@@ -306,11 +341,6 @@ func findTextFilesRecursive(dir string, additionalExtensions []string, matcher *
 	return files, nil
 }
 
-// isTextFile checks if a file has a text extension
-func isTextFile(path string) bool {
-	return isTextFileWithExtensions(path, nil)
-}
-
 // sortPaths sorts paths alphabetically
 func sortPaths(paths []string) {
 	sort.Strings(paths)
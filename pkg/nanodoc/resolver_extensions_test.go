@@ -1,20 +1,13 @@
 package nanodoc
 
 import (
-	"os"
 	"path/filepath"
 	"testing"
 )
 
 func TestResolveDirectoryWithAdditionalExtensions(t *testing.T) {
 	// Create a temporary directory with various files
-	tmpDir, err := os.MkdirTemp("", "nanodoc-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		_ = os.RemoveAll(tmpDir)
-	}()
+	tmpDir := t.TempDir()
 
 	// Create test files with different extensions
 	testFiles := map[string]string{
@@ -25,12 +18,7 @@ func TestResolveDirectoryWithAdditionalExtensions(t *testing.T) {
 		"file5.py":   "Content of py file",
 	}
 
-	for name, content := range testFiles {
-		path := filepath.Join(tmpDir, name)
-		if err := os.WriteFile(path, []byte(content), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
+	writeTestFiles(t, tmpDir, testFiles)
 
 	tests := []struct {
 		name                 string
@@ -45,6 +33,7 @@ func TestResolveDirectoryWithAdditionalExtensions(t *testing.T) {
 			expectedExtensions:   []string{".txt", ".md"},
 		},
 		{
+			// Directory expansion must honour --ext, not just explicit files
 			name: "With txxt extension",
 			options: &FormattingOptions{
 				AdditionalExtensions: []string{"txxt"},
@@ -100,59 +89,3 @@ func TestResolveDirectoryWithAdditionalExtensions(t *testing.T) {
 		})
 	}
 }
-
-func TestResolveDirectoryWithAdditionalExtensionsNoOptions(t *testing.T) {
-	// Test the specific bug case: directory expansion should respect additional extensions
-	tmpDir, err := os.MkdirTemp("", "nanodoc-txxt-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		_ = os.RemoveAll(tmpDir)
-	}()
-
-	// Create a .txxt file
-	txxtFile := filepath.Join(tmpDir, "spec.txxt")
-	if err := os.WriteFile(txxtFile, []byte("Txxt content"), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// Create a .txt file for comparison
-	txtFile := filepath.Join(tmpDir, "spec.txt")
-	if err := os.WriteFile(txtFile, []byte("Txt content"), 0644); err != nil {
-		t.Fatal(err)
-	}
-
-	// Test with --ext txxt option
-	options := &FormattingOptions{
-		AdditionalExtensions: []string{"txxt"},
-	}
-
-	paths, err := ResolvePathsWithOptions([]string{tmpDir}, options)
-	if err != nil {
-		t.Fatalf("Failed to resolve paths: %v", err)
-	}
-
-	if len(paths) != 1 {
-		t.Fatalf("Expected 1 path, got %d", len(paths))
-	}
-
-	// Should find both .txt and .txxt files
-	if len(paths[0].Files) != 2 {
-		t.Errorf("Expected 2 files (.txt and .txxt), got %d", len(paths[0].Files))
-		t.Logf("Found files: %v", paths[0].Files)
-	}
-
-	// Check that .txxt file is included
-	foundTxxt := false
-	for _, file := range paths[0].Files {
-		if filepath.Ext(file) == ".txxt" {
-			foundTxxt = true
-			break
-		}
-	}
-
-	if !foundTxxt {
-		t.Error("Expected to find .txxt file when using --ext txxt, but didn't")
-	}
-}
\ No newline at end of file
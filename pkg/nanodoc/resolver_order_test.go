@@ -1,31 +1,23 @@
 package nanodoc
 
 import (
-	"os"
 	"path/filepath"
 	"testing"
 )
 
 func TestResolvePathsPreservesOrder(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-order-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		_ = os.RemoveAll(tempDir)
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files with names that would sort differently alphabetically
+	writeTestFiles(t, tempDir, map[string]string{
+		"z-file.txt": "content",
+		"a-file.txt": "content",
+		"m-file.txt": "content",
+	})
 	fileZ := filepath.Join(tempDir, "z-file.txt")
 	fileA := filepath.Join(tempDir, "a-file.txt")
 	fileM := filepath.Join(tempDir, "m-file.txt")
-	
-	for _, file := range []string{fileZ, fileA, fileM} {
-		if err := os.WriteFile(file, []byte("content"), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
 
 	// Test cases with different orderings
 	tests := []struct {
@@ -73,34 +65,17 @@ func TestResolvePathsPreservesOrder(t *testing.T) {
 
 func TestResolvePathsWithDirectoryPreservesOrder(t *testing.T) {
 	// Create temp directory
-	tempDir, err := os.MkdirTemp("", "nanodoc-order-dir-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		_ = os.RemoveAll(tempDir)
-	}()
+	tempDir := t.TempDir()
 
-	// Create subdirectories
+	// Create files in two subdirectories and one at the top level
+	writeTestFiles(t, tempDir, map[string]string{
+		"a-dir/file.txt": "content",
+		"z-dir/file.txt": "content",
+		"standalone.txt": "content",
+	})
 	dirA := filepath.Join(tempDir, "a-dir")
 	dirZ := filepath.Join(tempDir, "z-dir")
-	
-	for _, dir := range []string{dirA, dirZ} {
-		if err := os.MkdirAll(dir, 0755); err != nil {
-			t.Fatal(err)
-		}
-	}
-
-	// Create files in directories
-	fileInA := filepath.Join(dirA, "file.txt")
-	fileInZ := filepath.Join(dirZ, "file.txt")
 	standaloneFile := filepath.Join(tempDir, "standalone.txt")
-	
-	for _, file := range []string{fileInA, fileInZ, standaloneFile} {
-		if err := os.WriteFile(file, []byte("content"), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
 
 	// Test with mixed directory and file arguments
 	sources := []string{dirZ, standaloneFile, dirA}
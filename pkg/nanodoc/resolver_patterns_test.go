@@ -7,6 +7,40 @@ import (
 	"testing"
 )
 
+// writeTestFiles creates each file in files, keyed by its path relative to
+// dir, along with any parent directories it needs.
+func writeTestFiles(t *testing.T, dir string, files map[string]string) {
+	t.Helper()
+	for path, content := range files {
+		fullPath := filepath.Join(dir, path)
+		if err := os.MkdirAll(filepath.Dir(fullPath), 0755); err != nil {
+			t.Fatal(err)
+		}
+		if err := os.WriteFile(fullPath, []byte(content), 0644); err != nil {
+			t.Fatal(err)
+		}
+	}
+}
+
+// chdir switches the working directory to dir for the rest of the test
+// and switches back when the test finishes. Tests that use it must not
+// call t.Parallel, since the working directory is process-wide.
+func chdir(t *testing.T, dir string) {
+	t.Helper()
+	oldDir, err := os.Getwd()
+	if err != nil {
+		t.Fatal(err)
+	}
+	if err := os.Chdir(dir); err != nil {
+		t.Fatal(err)
+	}
+	t.Cleanup(func() {
+		if err := os.Chdir(oldDir); err != nil {
+			t.Errorf("Failed to change back to original dir: %v", err)
+		}
+	})
+}
+
 func TestResolvePathsWithPatterns(t *testing.T) {
 	// Create test directory structure
 	tmpDir := t.TempDir()
@@ -23,16 +57,7 @@ func TestResolvePathsWithPatterns(t *testing.T) {
 		"test/integration.md":    "# Tests",
 	}
 	
-	for path, content := range testFiles {
-		fullPath := filepath.Join(tmpDir, path)
-		dir := filepath.Dir(fullPath)
-		if err := os.MkdirAll(dir, 0755); err != nil {
-			t.Fatal(err)
-		}
-		if err := os.WriteFile(fullPath, []byte(content), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
+	writeTestFiles(t, tmpDir, testFiles)
 	
 	tests := []struct {
 		name            string
@@ -50,7 +75,7 @@ func TestResolvePathsWithPatterns(t *testing.T) {
 		},
 		{
 			name:   "directory with include pattern",
-			source: filepath.Join(tmpDir),
+			source: tmpDir,
 			options: &FormattingOptions{
 				IncludePatterns: []string{"**/api/*.md"},
 			},
@@ -60,7 +85,7 @@ func TestResolvePathsWithPatterns(t *testing.T) {
 		},
 		{
 			name:   "directory with exclude pattern",
-			source: filepath.Join(tmpDir),
+			source: tmpDir,
 			options: &FormattingOptions{
 				ExcludePatterns: []string{"**/README.md"},
 			},
@@ -73,7 +98,7 @@ func TestResolvePathsWithPatterns(t *testing.T) {
 		},
 		{
 			name:   "include and exclude patterns",
-			source: filepath.Join(tmpDir),
+			source: tmpDir,
 			options: &FormattingOptions{
 				IncludePatterns: []string{"**/*.md"},
 				ExcludePatterns: []string{"**/test/**", "**/README.md"},
@@ -85,7 +110,7 @@ func TestResolvePathsWithPatterns(t *testing.T) {
 		},
 		{
 			name:   "additional extensions with patterns",
-			source: filepath.Join(tmpDir),
+			source: tmpDir,
 			options: &FormattingOptions{
 				AdditionalExtensions: []string{".go"},
 				IncludePatterns:      []string{"**/api/**"},
@@ -172,16 +197,7 @@ func TestDirectoryTraversalWithPatterns(t *testing.T) {
 		"vendor/github.com/foo/README.md":  "# Vendor",
 	}
 	
-	for path, content := range testFiles {
-		fullPath := filepath.Join(tmpDir, path)
-		dir := filepath.Dir(fullPath)
-		if err := os.MkdirAll(dir, 0755); err != nil {
-			t.Fatal(err)
-		}
-		if err := os.WriteFile(fullPath, []byte(content), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
+	writeTestFiles(t, tmpDir, testFiles)
 	
 	tests := []struct {
 		name      string
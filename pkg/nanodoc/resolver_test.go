@@ -8,39 +8,18 @@ import (
 
 func TestResolvePaths(t *testing.T) {
 	// Create temp directory for test files
-	tempDir, err := os.MkdirTemp("", "nanodoc-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
-	// Create test files
+	// Create files and directories
+	writeTestFiles(t, tempDir, map[string]string{
+		"test1.txt":        "content1",
+		"test2.md":         "content2",
+		"test.bundle.txt":  "bundle",
+		"subdir/test3.txt": "content3",
+	})
 	testFile1 := filepath.Join(tempDir, "test1.txt")
 	testFile2 := filepath.Join(tempDir, "test2.md")
 	testBundle := filepath.Join(tempDir, "test.bundle.txt")
-	subDir := filepath.Join(tempDir, "subdir")
-	testFile3 := filepath.Join(subDir, "test3.txt")
-
-	// Create files and directories
-	if err := os.WriteFile(testFile1, []byte("content1"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(testFile2, []byte("content2"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(testBundle, []byte("bundle"), 0644); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.Mkdir(subDir, 0755); err != nil {
-		t.Fatal(err)
-	}
-	if err := os.WriteFile(testFile3, []byte("content3"), 0644); err != nil {
-		t.Fatal(err)
-	}
 
 	tests := []struct {
 		name    string
@@ -150,15 +129,7 @@ func TestResolvePaths(t *testing.T) {
 
 func TestResolveGlobPath(t *testing.T) {
 	// Create temp directory for test files
-	tempDir, err := os.MkdirTemp("", "nanodoc-glob-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files
 	testFile1 := filepath.Join(tempDir, "file1.txt")
@@ -230,7 +201,7 @@ func TestResolveGlobPath(t *testing.T) {
 	}
 }
 
-func TestIsTextFile(t *testing.T) {
+func TestDefaultTextExtensions(t *testing.T) {
 	tests := []struct {
 		path string
 		want bool
@@ -247,8 +218,8 @@ func TestIsTextFile(t *testing.T) {
 
 	for _, tt := range tests {
 		t.Run(tt.path, func(t *testing.T) {
-			if got := isTextFile(tt.path); got != tt.want {
-				t.Errorf("isTextFile(%q) = %v, want %v", tt.path, got, tt.want)
+			if got := newTextExtensionSet(nil).contains(tt.path); got != tt.want {
+				t.Errorf("newTextExtensionSet(nil).contains(%q) = %v, want %v", tt.path, got, tt.want)
 			}
 		})
 	}
@@ -335,15 +306,7 @@ func TestSortPaths(t *testing.T) {
 
 func TestSymlinkHandling(t *testing.T) {
 	// Create temp directory for test files
-	tempDir, err := os.MkdirTemp("", "nanodoc-symlink-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create a real file
 	realFile := filepath.Join(tempDir, "real.txt")
@@ -375,30 +338,16 @@ func TestSymlinkHandling(t *testing.T) {
 
 func TestGetFilesFromDirectory(t *testing.T) {
 	// Create temp directory for test files
-	tempDir, err := os.MkdirTemp("", "nanodoc-getfiles-test-*")
-	if err != nil {
-		t.Fatal(err)
-	}
-	defer func() {
-		if err := os.RemoveAll(tempDir); err != nil {
-			t.Logf("Failed to remove temp dir: %v", err)
-		}
-	}()
+	tempDir := t.TempDir()
 
 	// Create test files
-	files := map[string]string{
+	writeTestFiles(t, tempDir, map[string]string{
 		"file1.txt": "content1",
 		"file2.md":  "content2",
 		"file3.py":  "content3",
 		"file4.go":  "content4",
 		"file5.rst": "content5",
-	}
-
-	for name, content := range files {
-		if err := os.WriteFile(filepath.Join(tempDir, name), []byte(content), 0644); err != nil {
-			t.Fatal(err)
-		}
-	}
+	})
 
 	tests := []struct {
 		name       string
@@ -439,3 +388,46 @@ func TestGetFilesFromDirectory(t *testing.T) {
 		})
 	}
 }
+
+func TestAbsPathResolver(t *testing.T) {
+	cwd, err := os.Getwd()
+	if err != nil {
+		t.Fatal(err)
+	}
+
+	tests := []struct {
+		name string
+		path string
+	}{
+		{name: "relative file", path: "file.txt"},
+		{name: "relative with dot-dot", path: "dir/../other.md"},
+		{name: "relative with dot", path: "./dir/./file.txt"},
+		{name: "current directory", path: "."},
+		{name: "parent directory", path: ".."},
+		{name: "rooted with dot", path: "/abs/./path.txt"},
+		{name: "rooted with dot-dot", path: "/abs/sub/../path.txt"},
+		{name: "absolute", path: filepath.Join(cwd, "file.txt")},
+		{name: "absolute with dot-dot", path: filepath.Join(cwd, "dir") + string(filepath.Separator) + ".." + string(filepath.Separator) + "file.txt"},
+	}
+
+	var resolver absPathResolver
+	for _, tt := range tests {
+		t.Run(tt.name, func(t *testing.T) {
+			want, err := filepath.Abs(tt.path)
+			if err != nil {
+				t.Fatal(err)
+			}
+			got, err := resolver.Abs(tt.path)
+			if err != nil {
+				t.Fatalf("Abs(%q) error = %v", tt.path, err)
+			}
+			if got != want {
+				t.Errorf("Abs(%q) = %q, want %q", tt.path, got, want)
+			}
+		})
+	}
+
+	if resolver.cwd != cwd {
+		t.Errorf("resolver.cwd = %q, want %q", resolver.cwd, cwd)
+	}
+}
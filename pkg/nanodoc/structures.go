@@ -41,6 +41,12 @@ type Document struct {
 
 	// Formatting options
 	FormattingOptions FormattingOptions
+
+	// First TOC title per file path, built lazily from TOC
+	tocTitles map[string]string
+
+	// Length of TOC when tocTitles was built
+	tocTitlesLen int
 }
 
 // TOCEntry represents an entry in the table of contents